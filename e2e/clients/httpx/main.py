@@ -1,8 +1,9 @@
 """httpx e2e test client using x402 v2 SDK."""
 
 import os
-import json
 import asyncio
+
+import orjson
 from dotenv import load_dotenv
 from eth_account import Account
 
@@ -27,15 +28,27 @@ endpoint_path = os.getenv("ENDPOINT_PATH")
 
 if not base_url or not endpoint_path:
     error_result = {"success": False, "error": "Missing required environment variables"}
-    print(json.dumps(error_result))
+    print(orjson.dumps(error_result).decode())
     exit(1)
 
 if not evm_private_key and not svm_private_key:
     error_result = {"success": False, "error": "At least one of EVM_PRIVATE_KEY or SVM_PRIVATE_KEY must be set"}
-    print(json.dumps(error_result))
+    print(orjson.dumps(error_result).decode())
     exit(1)
 
 
+# V2 and V1 settlement header names, lowercased for raw header comparison
+PAYMENT_RESPONSE_HEADERS = (b"payment-response", b"x-payment-response")
+
+
+def get_payment_response_header(response: httpx.Response) -> str | None:
+    """Return the settlement header value in a single pass over raw headers."""
+    for name, value in response.headers.raw:
+        if name.lower() in PAYMENT_RESPONSE_HEADERS:
+            return value.decode("latin-1")
+    return None
+
+
 async def main():
     # Create x402 client
     client = x402Client()
@@ -54,18 +67,28 @@ async def main():
     # Create httpx client with x402 payment transport and increased timeout
     # Set timeout to 30 seconds to handle busy servers during test runs
     timeout = httpx.Timeout(30.0, connect=10.0)
+    # HTTP/2 with a bounded keep-alive pool on the underlying transport, so the
+    # paid retry reuses the connection opened by the initial 402 request.
+    # (http2/limits must be set on the transport: AsyncClient ignores them
+    # when a custom transport is supplied.)
+    base_transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+        ),
+    )
     async with httpx.AsyncClient(
         base_url=base_url,
         timeout=timeout,
-        transport=x402_httpx_transport(client),
+        transport=x402_httpx_transport(client, base_transport),
     ) as http_client:
         # Make request
         try:
             response = await http_client.get(endpoint_path)
 
-            # Read the response content
-            content = response.content
-            response_data = json.loads(content.decode())
+            # Read the body as bytes and parse it directly; orjson needs no
+            # intermediate str decode
+            response_data = orjson.loads(await response.aread())
 
             # Prepare result
             result = {
@@ -76,24 +99,24 @@ async def main():
             }
 
             # Check for payment response header (V2: PAYMENT-RESPONSE, V1: X-PAYMENT-RESPONSE)
-            payment_header = response.headers.get("PAYMENT-RESPONSE") or response.headers.get("X-PAYMENT-RESPONSE")
+            payment_header = get_payment_response_header(response)
             if payment_header:
                 payment_response = decode_payment_response_header(payment_header)
                 result["payment_response"] = payment_response.model_dump()
 
             # Output structured result as JSON for proxy to parse
-            print(json.dumps(result))
+            print(orjson.dumps(result).decode())
             exit(0)
 
         except Exception as e:
             error_result = {
                 "success": False,
                 "error": str(e),
-                "status_code": getattr(e, "response", {}).get("status_code", None)
-                if hasattr(e, "response")
+                "status_code": e.response.status_code
+                if isinstance(e, httpx.HTTPStatusError)
                 else None,
             }
-            print(json.dumps(error_result))
+            print(orjson.dumps(error_result).decode())
             exit(1)
 
 
@@ -3,9 +3,37 @@
 This module provides a simple in-memory catalog for discovered resources during e2e testing
 """
 
-from datetime import datetime
+import time
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
+
+# (epoch second, formatted timestamp) for the most recent _iso_now() call
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO 8601 string, second precision.
+
+    The formatted string is cached for the current second, so bursts of
+    catalog inserts skip datetime construction and formatting.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    cached_at, formatted = _timestamp_cache
+    if cached_at != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize Pydantic models (such as discovery info) for orjson."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(by_alias=True, exclude_none=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class DiscoveredResource:
     """A discovered resource entry in the bazaar catalog."""
@@ -16,19 +44,32 @@ class DiscoveredResource:
         resource_type: str,
         x402_version: int,
         accepts: list[dict[str, Any]],
-        discovery_info: dict[str, Any] | None = None,
+        discovery_info: Any = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
+        """Create a catalog entry.
+
+        ``discovery_info`` may be a dict or a Pydantic model; models are kept
+        as-is and dumped once, when the entry is first serialized to JSON.
+        """
         self.resource = resource
         self.type = resource_type
         self.x402_version = x402_version
         self.accepts = accepts
         self.discovery_info = discovery_info
-        self.last_updated = datetime.now().isoformat()
+        self.last_updated = _iso_now()
         self.metadata = metadata or {}
+        self._dict_cache: dict[str, Any] | None = None
+        self._json_cache: bytes | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        The result is memoized; entries are replaced rather than mutated,
+        so the cached dict stays valid for the lifetime of the instance.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
         result: dict[str, Any] = {
             "resource": self.resource,
             "type": self.type,
@@ -39,22 +80,32 @@ class DiscoveredResource:
         }
         if self.discovery_info:
             result["discoveryInfo"] = self.discovery_info
+        self._dict_cache = result
         return result
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, memoized alongside the dict form."""
+        if self._json_cache is None:
+            self._json_cache = orjson.dumps(self.to_dict(), default=_json_default)
+        return self._json_cache
+
 
 class BazaarCatalog:
     """Catalog for storing discovered x402 resources.
     """
 
     def __init__(self) -> None:
-        self._resources: dict[str, DiscoveredResource] = {}
+        # Resources in insertion order, plus URL -> position, so pagination
+        # slices the list directly instead of materializing dict values.
+        self._order: list[DiscoveredResource] = []
+        self._index: dict[str, int] = {}
 
     def catalog_resource(
         self,
         resource_url: str,
         method: str,
         x402_version: int,
-        discovery_info: dict[str, Any] | None,
+        discovery_info: Any,
         payment_requirements: dict[str, Any],
     ) -> None:
         """Add a discovered resource to the catalog.
@@ -63,14 +114,14 @@ class BazaarCatalog:
             resource_url: The URL of the discovered resource.
             method: The HTTP method (GET, POST, etc.).
             x402_version: The x402 protocol version.
-            discovery_info: Optional discovery metadata.
+            discovery_info: Optional discovery metadata (dict or Pydantic model).
             payment_requirements: The payment requirements for this resource.
         """
         print(f"📝 Discovered resource: {resource_url}")
         print(f"   Method: {method}")
         print(f"   x402 Version: {x402_version}")
 
-        self._resources[resource_url] = DiscoveredResource(
+        resource = DiscoveredResource(
             resource=resource_url,
             resource_type="http",
             x402_version=x402_version,
@@ -78,34 +129,48 @@ class BazaarCatalog:
             discovery_info=discovery_info,
             metadata={},
         )
+        # Pre-serialize once so listing endpoints only concatenate bytes
+        resource.to_json()
+
+        position = self._index.get(resource_url)
+        if position is None:
+            self._index[resource_url] = len(self._order)
+            self._order.append(resource)
+        else:
+            self._order[position] = resource
 
-    def get_resources(
+    def iter_resources_json(
         self, limit: int = 100, offset: int = 0
-    ) -> dict[str, Any]:
-        """Get paginated list of discovered resources.
+    ) -> Iterator[bytes]:
+        """Get paginated list of discovered resources as JSON byte chunks.
+
+        The page is selected eagerly; the returned iterator then yields the
+        envelope and one cached serialization per resource, suitable for a
+        streaming response.
 
         Args:
             limit: Maximum number of resources to return.
             offset: Number of resources to skip.
 
         Returns:
-            Dictionary with x402Version, items, and pagination info.
+            Iterator over chunks of the JSON-encoded discovery response.
         """
-        all_resources = list(self._resources.values())
-        total = len(all_resources)
-        items = all_resources[offset : offset + limit]
-
-        return {
-            "x402Version": 2,
-            "items": [r.to_dict() for r in items],
-            "pagination": {
-                "limit": limit,
-                "offset": offset,
-                "total": total,
-            },
-        }
+        items = self._order[offset : offset + limit]
+        pagination = {"limit": limit, "offset": offset, "total": len(self._order)}
+        return self._iter_page_json(items, pagination)
+
+    @staticmethod
+    def _iter_page_json(
+        items: list[DiscoveredResource], pagination: dict[str, int]
+    ) -> Iterator[bytes]:
+        yield b'{"x402Version":2,"items":['
+        for i, resource in enumerate(items):
+            if i:
+                yield b","
+            yield resource.to_json()
+        yield b'],"pagination":' + orjson.dumps(pagination) + b"}"
 
     def get_count(self) -> int:
         """Get total count of discovered resources."""
-        return len(self._resources)
+        return len(self._order)
 
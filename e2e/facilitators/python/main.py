@@ -17,10 +17,13 @@ import sys
 from datetime import datetime
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 from solders.keypair import Keypair
+from typing_extensions import TypedDict
 
 from x402 import x402Facilitator
 from x402.extensions.bazaar import DiscoveredResource, extract_discovery_info
@@ -28,6 +31,7 @@ from x402.mechanisms.evm import FacilitatorWeb3Signer
 from x402.mechanisms.evm.exact import register_exact_evm_facilitator
 from x402.mechanisms.svm import FacilitatorKeypairSigner
 from x402.mechanisms.svm.exact import register_exact_svm_facilitator
+from x402.schemas import parse_payment_payload, parse_payment_requirements
 
 from bazaar import BazaarCatalog
 
@@ -36,6 +40,7 @@ load_dotenv()
 
 # Configuration
 PORT = int(os.environ.get("PORT", "4022"))
+TRACE = os.environ.get("X402_TRACE") == "1"
 
 # Initialize bazaar catalog
 bazaar_catalog = BazaarCatalog()
@@ -55,12 +60,14 @@ evm_signer = FacilitatorWeb3Signer(
     private_key=os.environ["EVM_PRIVATE_KEY"],
     rpc_url=evm_rpc_url,
 )
-print(f"EVM Facilitator account: {evm_signer.get_addresses()[0]}")
+EVM_ADDRESS = evm_signer.get_addresses()[0]
+print(f"EVM Facilitator account: {EVM_ADDRESS}")
 
 # Initialize the SVM signer from private key
 svm_keypair = Keypair.from_base58_string(os.environ["SVM_PRIVATE_KEY"])
 svm_signer = FacilitatorKeypairSigner(svm_keypair)
-print(f"SVM Facilitator account: {svm_signer.get_addresses()[0]}")
+SVM_ADDRESS = svm_signer.get_addresses()[0]
+print(f"SVM Facilitator account: {SVM_ADDRESS}")
 
 
 def _handle_after_verify(ctx: Any) -> None:
@@ -69,9 +76,17 @@ def _handle_after_verify(ctx: Any) -> None:
 
     # Extract discovered resource from payment for bazaar catalog
     try:
+        # Dump requirements once: the same dict feeds discovery extraction
+        # (which would otherwise call model_dump itself) and the catalog entry.
+        requirements_dict = (
+            ctx.requirements.model_dump(by_alias=True)
+            if hasattr(ctx.requirements, "model_dump")
+            else ctx.requirements
+        )
+
         discovered = extract_discovery_info(
             ctx.payment_payload,
-            ctx.requirements,
+            requirements_dict,
             validate=True,
         )
 
@@ -80,24 +95,12 @@ def _handle_after_verify(ctx: Any) -> None:
             print(f"   📝 Method: {discovered.method}")
             print(f"   📝 X402Version: {discovered.x402_version}")
 
-            # Convert discovery_info to dict for serialization
-            discovery_info_dict = None
-            if discovered.discovery_info:
-                if hasattr(discovered.discovery_info, "model_dump"):
-                    discovery_info_dict = discovered.discovery_info.model_dump(
-                        by_alias=True, exclude_none=True
-                    )
-                else:
-                    discovery_info_dict = discovered.discovery_info
-
             bazaar_catalog.catalog_resource(
                 resource_url=discovered.resource_url,
                 method=discovered.method,
                 x402_version=discovered.x402_version,
-                discovery_info=discovery_info_dict,
-                payment_requirements=ctx.requirements.model_dump(by_alias=True)
-                if hasattr(ctx.requirements, "model_dump")
-                else ctx.requirements,
+                discovery_info=discovered.discovery_info,
+                payment_requirements=requirements_dict,
             )
             print("   ✅ Added to bazaar catalog")
     except Exception as err:
@@ -107,14 +110,22 @@ def _handle_after_verify(ctx: Any) -> None:
 # Initialize the x402 Facilitator with EVM and SVM support
 facilitator = (
     x402Facilitator()
-    .on_before_verify(lambda ctx: print("Before verify", ctx))
-    .on_after_verify(lambda ctx: _handle_after_verify(ctx))
+    .on_after_verify(_handle_after_verify)
     .on_verify_failure(lambda ctx: print("Verify failure", ctx))
-    .on_before_settle(lambda ctx: print("Before settle", ctx))
-    .on_after_settle(lambda ctx: print(f"🎉 Payment settled: {ctx.result.transaction}"))
     .on_settle_failure(lambda ctx: print("Settle failure", ctx))
 )
 
+# Per-request trace hooks are opt-in: unregistered hooks cost nothing on
+# the verify/settle path.
+if TRACE:
+    (
+        facilitator.on_before_verify(lambda ctx: print("Before verify", ctx))
+        .on_before_settle(lambda ctx: print("Before settle", ctx))
+        .on_after_settle(
+            lambda ctx: print(f"🎉 Payment settled: {ctx.result.transaction}")
+        )
+    )
+
 # Register EVM schemes (V1 and V2)
 register_exact_evm_facilitator(
     facilitator,
@@ -131,19 +142,44 @@ register_exact_svm_facilitator(
 )
 
 
-# Pydantic models for request/response
-class VerifyRequest(BaseModel):
-    """Verify endpoint request body."""
+class PaymentRequestBody(TypedDict):
+    """Request body shared by the /verify and /settle endpoints."""
+
+    paymentPayload: dict[str, Any]
+    paymentRequirements: dict[str, Any]
+
 
-    paymentPayload: dict
-    paymentRequirements: dict
+# Parses and validates raw JSON bytes in one pass inside pydantic-core,
+# without constructing a BaseModel per request.
+payment_request_adapter = TypeAdapter(PaymentRequestBody)
 
 
-class SettleRequest(BaseModel):
-    """Settle endpoint request body."""
+async def read_payment_body(request: Request) -> PaymentRequestBody:
+    """Parse and validate a /verify or /settle request body.
 
-    paymentPayload: dict
-    paymentRequirements: dict
+    Args:
+        request: Incoming request.
+
+    Returns:
+        Dict with paymentPayload and paymentRequirements.
+
+    Raises:
+        HTTPException: 422 if the body is not valid JSON or is missing fields.
+    """
+    try:
+        return payment_request_adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=e.errors(include_url=False, include_input=False),
+        )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 # Initialize FastAPI app
@@ -151,28 +187,31 @@ app = FastAPI(
     title="x402 Python Facilitator (E2E)",
     description="Verifies and settles x402 payments on-chain for e2e testing",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.post("/verify")
-async def verify(request: VerifyRequest):
+async def verify(request: Request):
     """Verify a payment against requirements.
 
     Note: Payment tracking and bazaar discovery are handled by lifecycle hooks.
 
     Args:
-        request: Payment payload and requirements to verify.
+        request: Request whose body holds the payment payload and requirements.
 
     Returns:
         VerifyResponse with isValid and payer (if valid) or invalidReason.
     """
-    try:
-        from x402.schemas import parse_payment_payload, parse_payment_requirements
+    body = await read_payment_body(request)
+    payment_payload = body["paymentPayload"]
+    payment_requirements = body["paymentRequirements"]
 
+    try:
         # Parse payload (auto-detects V1/V2) and requirements (based on payload version)
-        payload = parse_payment_payload(request.paymentPayload)
+        payload = parse_payment_payload(payment_payload)
         requirements = parse_payment_requirements(
-            payload.x402_version, request.paymentRequirements
+            payload.x402_version, payment_requirements
         )
 
         # Hooks will automatically:
@@ -191,24 +230,26 @@ async def verify(request: VerifyRequest):
 
 
 @app.post("/settle")
-async def settle(request: SettleRequest):
+async def settle(request: Request):
     """Settle a payment on-chain.
 
     Note: Verification validation and cleanup are handled by lifecycle hooks.
 
     Args:
-        request: Payment payload and requirements to settle.
+        request: Request whose body holds the payment payload and requirements.
 
     Returns:
         SettleResponse with success, transaction, network, and payer.
     """
-    try:
-        from x402.schemas import parse_payment_payload, parse_payment_requirements
+    body = await read_payment_body(request)
+    payment_payload = body["paymentPayload"]
+    payment_requirements = body["paymentRequirements"]
 
+    try:
         # Parse payload (auto-detects V1/V2) and requirements (based on payload version)
-        payload = parse_payment_payload(request.paymentPayload)
+        payload = parse_payment_payload(payment_payload)
         requirements = parse_payment_requirements(
-            payload.x402_version, request.paymentRequirements
+            payload.x402_version, payment_requirements
         )
 
         # Hooks will automatically:
@@ -233,7 +274,7 @@ async def settle(request: SettleRequest):
             return {
                 "success": False,
                 "errorReason": str(e).replace("Settlement aborted: ", ""),
-                "network": request.paymentPayload.get("accepted", {}).get(
+                "network": payment_payload.get("accepted", {}).get(
                     "network", "unknown"
                 ),
                 "transaction": "",
@@ -278,11 +319,13 @@ async def discovery_resources(limit: int = 100, offset: int = 0):
     Returns:
         Discovery response with x402Version, items, and pagination.
     """
-    try:
-        return bazaar_catalog.get_resources(limit, offset)
-    except Exception as e:
-        print(f"Discovery error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    chunks = bazaar_catalog.iter_resources_json(limit, offset)
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 @app.get("/health")
@@ -305,11 +348,8 @@ async def close():
 
     print("Received shutdown request")
 
-    async def shutdown():
-        await asyncio.sleep(0.1)
-        os._exit(0)
-
-    asyncio.create_task(shutdown())
+    # Exit shortly after the response is sent
+    asyncio.get_running_loop().call_later(0.1, os._exit, 0)
     return {"message": "Facilitator shutting down gracefully"}
 
 
@@ -322,7 +362,7 @@ if __name__ == "__main__":
 ╠════════════════════════════════════════════════════════╣
 ║  Server:     http://localhost:{PORT}                       ║
 ║  Network:    eip155:84532                              ║
-║  Address:    {evm_signer.get_addresses()[0]}  ║
+║  Address:    {EVM_ADDRESS}  ║
 ║  Extensions: bazaar                                    ║
 ║                                                        ║
 ║  Endpoints:                                            ║
@@ -338,4 +378,14 @@ if __name__ == "__main__":
     # Log that facilitator is ready (needed for e2e test discovery)
     print("Facilitator listening")
 
-    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning")
+    # uvloop + httptools replace the asyncio loop and h11 parser. Stay on a
+    # single worker: the bazaar catalog and facilitator hooks hold
+    # in-process state.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=PORT,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
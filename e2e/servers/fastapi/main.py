@@ -6,6 +6,8 @@ import sys
 import asyncio
 from typing import Any, Dict
 
+import httpx
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
@@ -46,16 +48,34 @@ if not SVM_ADDRESS:
 EVM_NETWORK = "eip155:84532"  # Base Sepolia
 SVM_NETWORK = "solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1"  # Solana Devnet
 
-app = FastAPI()
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Pooled HTTP/2 client shared by all verify/settle calls to the facilitator
+facilitator_http_client = httpx.AsyncClient(
+    timeout=30.0,
+    follow_redirects=True,
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+    ),
+)
 
 # Create HTTP facilitator client
 if FACILITATOR_URL:
     print(f"Using remote facilitator at: {FACILITATOR_URL}")
-    config = FacilitatorConfig(url=FACILITATOR_URL)
-    facilitator = HTTPFacilitatorClient(config)
+    config = FacilitatorConfig(url=FACILITATOR_URL, http_client=facilitator_http_client)
 else:
     print("Using default facilitator")
-    facilitator = HTTPFacilitatorClient()
+    config = FacilitatorConfig(http_client=facilitator_http_client)
+facilitator = HTTPFacilitatorClient(config)
 
 # Create resource server
 server = x402ResourceServer(facilitator)
@@ -67,6 +87,26 @@ register_exact_svm_server(server, SVM_NETWORK)
 # Register Bazaar discovery extension
 server.register_extension(bazaar_resource_server_extension)
 
+# Output schema shared by every protected route's discovery metadata
+MESSAGE_OUTPUT_SCHEMA = {
+    "properties": {
+        "message": {"type": "string"},
+        "timestamp": {"type": "string"},
+    },
+    "required": ["message", "timestamp"],
+}
+
+
+def message_discovery_extension(message: str) -> Dict[str, Any]:
+    """Declare bazaar discovery for a route returning a message/timestamp body."""
+    return declare_discovery_extension(
+        output=OutputConfig(
+            example={"message": message, "timestamp": "2024-01-01T00:00:00Z"},
+            schema=MESSAGE_OUTPUT_SCHEMA,
+        )
+    )
+
+
 # Define routes with payment requirements
 routes = {
     "GET /protected": {
@@ -77,21 +117,7 @@ routes = {
             "network": EVM_NETWORK,
         },
         "extensions": {
-            **declare_discovery_extension(
-                output=OutputConfig(
-                    example={
-                        "message": "Access granted to protected resource",
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    },
-                    schema={
-                        "properties": {
-                            "message": {"type": "string"},
-                            "timestamp": {"type": "string"},
-                        },
-                        "required": ["message", "timestamp"],
-                    },
-                )
-            ),
+            **message_discovery_extension("Access granted to protected resource"),
         },
     },
     "GET /protected-2": {
@@ -102,21 +128,7 @@ routes = {
             "network": EVM_NETWORK,
         },
         "extensions": {
-            **declare_discovery_extension(
-                output=OutputConfig(
-                    example={
-                        "message": "Access granted to protected resource #2",
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    },
-                    schema={
-                        "properties": {
-                            "message": {"type": "string"},
-                            "timestamp": {"type": "string"},
-                        },
-                        "required": ["message", "timestamp"],
-                    },
-                )
-            ),
+            **message_discovery_extension("Access granted to protected resource #2"),
         },
     },
     "GET /protected-svm": {
@@ -127,30 +139,21 @@ routes = {
             "network": SVM_NETWORK,
         },
         "extensions": {
-            **declare_discovery_extension(
-                output=OutputConfig(
-                    example={
-                        "message": "Access granted to SVM protected resource",
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    },
-                    schema={
-                        "properties": {
-                            "message": {"type": "string"},
-                            "timestamp": {"type": "string"},
-                        },
-                        "required": ["message", "timestamp"],
-                    },
-                )
-            ),
+            **message_discovery_extension("Access granted to SVM protected resource"),
         },
     },
 }
 
 
+# Build the payment middleware once; constructing it per request would
+# rebuild the route table and re-sync with the facilitator every time.
+x402_middleware = payment_middleware(routes, server)
+
+
 # Apply payment middleware
 @app.middleware("http")
 async def x402_payment_middleware(request, call_next):
-    return await payment_middleware(routes, server)(request, call_next)
+    return await x402_middleware(request, call_next)
 
 
 # Global flag to track if server should accept new requests
@@ -210,11 +213,7 @@ async def close_server() -> Dict[str, Any]:
     shutdown_requested = True
 
     # Schedule server shutdown after response
-    async def delayed_shutdown():
-        await asyncio.sleep(0.1)
-        os.kill(os.getpid(), signal.SIGTERM)
-
-    asyncio.create_task(delayed_shutdown())
+    asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
 
     return {
         "message": "Server shutting down gracefully",
@@ -243,4 +242,13 @@ if __name__ == "__main__":
     print(f"Using facilitator: {FACILITATOR_URL}")
     print("Server listening on port", PORT)
 
-    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning")
+    # uvloop + httptools replace the asyncio loop and h11 parser. Stay on a
+    # single worker so /close can shut the server down by signalling itself.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=PORT,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
@@ -1,11 +1,17 @@
 """Flask e2e test server using x402 v2 SDK."""
 
+import atexit
 import os
 import signal
 import sys
 import logging
-from flask import Flask, jsonify
+from typing import Any
 
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Import from new x402 package (sync variants for Flask)
@@ -21,7 +27,6 @@ from x402.extensions.bazaar import (
 )
 
 # Configure logging to reduce verbosity
-logging.getLogger("werkzeug").setLevel(logging.ERROR)
 logging.getLogger("flask").setLevel(logging.ERROR)
 
 # Load environment variables
@@ -45,16 +50,46 @@ if not SVM_ADDRESS:
 EVM_NETWORK = "eip155:84532"  # Base Sepolia
 SVM_NETWORK = "solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1"  # Solana Devnet
 
-app = Flask(__name__)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype,
+        )
+
+
+app = Flask(__name__, static_folder=None)
+app.json = OrjsonProvider(app)
+
+# Pooled HTTP/2 client shared by all verify/settle calls to the facilitator
+facilitator_http_client = httpx.Client(
+    timeout=30.0,
+    follow_redirects=True,
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+    ),
+)
+atexit.register(facilitator_http_client.close)
 
 # Create HTTP facilitator client (sync for Flask)
 if FACILITATOR_URL:
     print(f"Using remote facilitator at: {FACILITATOR_URL}")
-    config = FacilitatorConfig(url=FACILITATOR_URL)
-    facilitator = HTTPFacilitatorClientSync(config)
+    config = FacilitatorConfig(url=FACILITATOR_URL, http_client=facilitator_http_client)
 else:
     print("Using default facilitator")
-    facilitator = HTTPFacilitatorClientSync()
+    config = FacilitatorConfig(http_client=facilitator_http_client)
+facilitator = HTTPFacilitatorClientSync(config)
 
 # Create resource server (sync for Flask)
 server = x402ResourceServerSync(facilitator)
@@ -66,6 +101,46 @@ register_exact_svm_server(server, SVM_NETWORK)
 # Register Bazaar discovery extension
 server.register_extension(bazaar_resource_server_extension)
 
+# Response payloads of the protected routes. Each one doubles as the Bazaar
+# output example and, encoded once below, as the handler's response body.
+PROTECTED_RESPONSE = {
+    "message": "Access granted to protected resource",
+    "timestamp": "2024-01-01T00:00:00Z",
+    "data": {"resource": "premium_content", "access_level": "paid"},
+}
+PROTECTED_SVM_RESPONSE = {
+    "message": "Access granted to SVM protected resource",
+    "timestamp": "2024-01-01T00:00:00Z",
+}
+
+# Bazaar discovery declarations for the protected routes
+PROTECTED_DISCOVERY_EXTENSION = declare_discovery_extension(
+    output=OutputConfig(
+        example=PROTECTED_RESPONSE,
+        schema={
+            "properties": {
+                "message": {"type": "string"},
+                "timestamp": {"type": "string"},
+                "data": {"type": "object"},
+            },
+            "required": ["message", "timestamp"],
+        },
+    )
+)
+
+PROTECTED_SVM_DISCOVERY_EXTENSION = declare_discovery_extension(
+    output=OutputConfig(
+        example=PROTECTED_SVM_RESPONSE,
+        schema={
+            "properties": {
+                "message": {"type": "string"},
+                "timestamp": {"type": "string"},
+            },
+            "required": ["message", "timestamp"],
+        },
+    )
+)
+
 # Define routes with payment requirements
 routes = {
     "GET /protected": {
@@ -75,25 +150,7 @@ routes = {
             "price": "$0.001",
             "network": EVM_NETWORK,
         },
-        "extensions": {
-            **declare_discovery_extension(
-                output=OutputConfig(
-                    example={
-                        "message": "Access granted to protected resource",
-                        "timestamp": "2024-01-01T00:00:00Z",
-                        "data": {"resource": "premium_content", "access_level": "paid"},
-                    },
-                    schema={
-                        "properties": {
-                            "message": {"type": "string"},
-                            "timestamp": {"type": "string"},
-                            "data": {"type": "object"},
-                        },
-                        "required": ["message", "timestamp"],
-                    },
-                )
-            ),
-        },
+        "extensions": {**PROTECTED_DISCOVERY_EXTENSION},
     },
     "GET /protected-svm": {
         "accepts": {
@@ -102,68 +159,83 @@ routes = {
             "price": "$0.001",
             "network": SVM_NETWORK,
         },
-        "extensions": {
-            **declare_discovery_extension(
-                output=OutputConfig(
-                    example={
-                        "message": "Access granted to SVM protected resource",
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    },
-                    schema={
-                        "properties": {
-                            "message": {"type": "string"},
-                            "timestamp": {"type": "string"},
-                        },
-                        "required": ["message", "timestamp"],
-                    },
-                )
-            ),
-        },
+        "extensions": {**PROTECTED_SVM_DISCOVERY_EXTENSION},
     },
 }
 
+
 # Apply payment middleware
 PaymentMiddleware(app, routes, server)
 
 # Global flag to track if server should accept new requests
 shutdown_requested = False
 
+# Constant response bodies, encoded once at import. Handlers return them as
+# (body, headers) tuples so Flask builds a fresh Response around the bytes.
+JSON_HEADERS = {"Content-Type": "application/json"}
+PROTECTED_BODY = orjson.dumps(PROTECTED_RESPONSE)
+PROTECTED_SVM_BODY = orjson.dumps(PROTECTED_SVM_RESPONSE)
+HEALTH_BODY = orjson.dumps(
+    {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z", "server": "flask"}
+)
+SHUTTING_DOWN_BODY = orjson.dumps({"error": "Server shutting down"})
+
 
 @app.route("/protected")
 def protected_endpoint():
     """Protected endpoint that requires payment."""
     if shutdown_requested:
-        return jsonify({"error": "Server shutting down"}), 503
+        return SHUTTING_DOWN_BODY, 503, JSON_HEADERS
 
-    return jsonify(
-        {
-            "message": "Access granted to protected resource",
-            "timestamp": "2024-01-01T00:00:00Z",
-            "data": {"resource": "premium_content", "access_level": "paid"},
-        }
-    )
+    return PROTECTED_BODY, JSON_HEADERS
 
 
 @app.route("/protected-svm")
 def protected_svm_endpoint():
     """Protected endpoint that requires SVM (Solana) payment."""
     if shutdown_requested:
-        return jsonify({"error": "Server shutting down"}), 503
+        return SHUTTING_DOWN_BODY, 503, JSON_HEADERS
 
-    return jsonify(
-        {
-            "message": "Access granted to SVM protected resource",
-            "timestamp": "2024-01-01T00:00:00Z",
-        }
-    )
+    return PROTECTED_SVM_BODY, JSON_HEADERS
 
 
 @app.route("/health")
 def health_check():
     """Health check endpoint."""
-    return jsonify(
-        {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z", "server": "flask"}
-    )
+    return HEALTH_BODY, JSON_HEADERS
+
+
+class StaticRoutes:
+    """WSGI wrapper that answers constant, unpaid GET routes directly.
+
+    Matching requests never reach Flask or PaymentMiddleware; the precomputed
+    body is handed straight back to the server. Paid routes are deliberately
+    not served from here: every X-PAYMENT must still be verified and settled.
+    """
+
+    def __init__(self, wsgi_app, routes: dict[str, bytes]) -> None:
+        self.wsgi_app = wsgi_app
+        self.routes = {
+            path: (
+                [
+                    ("Content-Type", "application/json"),
+                    ("Content-Length", str(len(body))),
+                ],
+                [body],
+            )
+            for path, body in routes.items()
+        }
+
+    def __call__(self, environ, start_response):
+        if environ["REQUEST_METHOD"] == "GET":
+            hit = self.routes.get(environ["PATH_INFO"])
+            if hit is not None:
+                start_response("200 OK", hit[0])
+                return hit[1]
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = StaticRoutes(app.wsgi_app, {"/health": HEALTH_BODY})
 
 
 @app.route("/close", methods=["POST"])
@@ -172,14 +244,8 @@ def close_server():
     global shutdown_requested
     shutdown_requested = True
 
-    # Schedule server shutdown after response
-    def shutdown():
-        os.kill(os.getpid(), signal.SIGTERM)
-
-    import threading
-
-    timer = threading.Timer(0.1, shutdown)
-    timer.start()
+    # Schedule server shutdown after response (SIGALRM -> alarm_handler)
+    signal.setitimer(signal.ITIMER_REAL, 0.1)
 
     return jsonify(
         {
@@ -189,16 +255,45 @@ def close_server():
     )
 
 
+# All routes are registered; compile the URL map now rather than on the
+# first request.
+app.url_map.update()
+
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     print("Received shutdown signal, exiting...")
     sys.exit(0)
 
 
+def alarm_handler(signum, frame):
+    """Turn the /close shutdown timer into a SIGTERM for the server."""
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
 if __name__ == "__main__":
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGALRM, alarm_handler)
+
+    # Opt-in sampling profiler: attach py-spy to this process and write a
+    # flamegraph when the server exits. Needs py-spy on PATH; never set in CI.
+    if os.getenv("X402_PYSPY"):
+        import subprocess
+
+        subprocess.Popen(
+            [
+                "py-spy",
+                "record",
+                "--rate",
+                "500",
+                "-o",
+                os.getenv("X402_PYSPY_OUTPUT", "/tmp/x402-flask.svg"),
+                "--pid",
+                str(os.getpid()),
+            ]
+        )
 
     print(f"Starting Flask server on port {PORT}")
     print(f"EVM address: {EVM_ADDRESS}")
@@ -208,9 +303,21 @@ if __name__ == "__main__":
     print(f"Using facilitator: {FACILITATOR_URL}")
     print("Server listening on port", PORT)
 
-    app.run(
+    import uvicorn
+    from a2wsgi import WSGIMiddleware
+
+    # Serve the WSGI app from uvicorn (uvloop + httptools) instead of
+    # Werkzeug's dev server. Flask handlers run on a2wsgi's thread pool, so
+    # blocking facilitator calls don't serialize requests. Stay on a single
+    # process: shutdown_requested and /close rely on in-process state.
+    # Keep idle connections open for the length of a test run so clients
+    # reuse sockets instead of paying connect/accept/close per request.
+    uvicorn.run(
+        WSGIMiddleware(app, workers=32),
         host="0.0.0.0",
         port=PORT,
-        debug=False,  # Disable debug mode to reduce logs
-        use_reloader=False,  # Disable reloader to reduce logs
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=30,
+        log_level="warning",
     )
@@ -0,0 +1,11 @@
+"""Shared environment loading for the advanced examples."""
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def ensure_env() -> None:
+    """Load the .env file once per process, however many examples import it."""
+    load_dotenv()
@@ -13,7 +13,7 @@ import asyncio
 import os
 import sys
 
-from dotenv import load_dotenv
+import httpx
 from eth_account import Account
 
 from x402 import x402Client
@@ -22,7 +22,9 @@ from x402.http.clients import x402HttpxClient
 from x402.mechanisms.evm import EthAccountSigner
 from x402.mechanisms.evm.exact import ExactEvmScheme
 
-load_dotenv()
+from _env import ensure_env
+
+ensure_env()
 
 
 async def run_builder_pattern_example(
@@ -30,6 +32,7 @@ async def run_builder_pattern_example(
     url: str,
     mainnet_key: str | None = None,
     testnet_key: str | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
 ) -> None:
     """Run the builder pattern example.
 
@@ -38,6 +41,7 @@ async def run_builder_pattern_example(
         url: URL to make the request to.
         mainnet_key: Optional separate key for mainnet (defaults to private_key).
         testnet_key: Optional separate key for testnet (defaults to private_key).
+        transport: Optional shared httpx transport to send requests through.
     """
     print("🔧 Creating client with builder pattern...\n")
 
@@ -51,20 +55,25 @@ async def run_builder_pattern_example(
     mainnet_signer = EthAccountSigner(mainnet_account)
     testnet_signer = EthAccountSigner(testnet_account)
 
+    # One scheme per signer - networks sharing a signer share the scheme too
+    default_scheme = ExactEvmScheme(default_signer)
+    mainnet_scheme = ExactEvmScheme(mainnet_signer)
+    testnet_scheme = ExactEvmScheme(testnet_signer)
+
     # Builder pattern allows fine-grained control over network registration
     # More specific patterns take precedence over wildcards
     client = (
         x402Client()
         # Wildcard: All EVM networks (fallback)
-        .register("eip155:*", ExactEvmScheme(default_signer))
+        .register("eip155:*", default_scheme)
         # Specific: Ethereum mainnet with dedicated signer
-        .register("eip155:1", ExactEvmScheme(mainnet_signer))
+        .register("eip155:1", mainnet_scheme)
         # Specific: Base mainnet
-        .register("eip155:8453", ExactEvmScheme(mainnet_signer))
+        .register("eip155:8453", mainnet_scheme)
         # Specific: Base Sepolia testnet with testnet signer
-        .register("eip155:84532", ExactEvmScheme(testnet_signer))
+        .register("eip155:84532", testnet_scheme)
         # Specific: Sepolia testnet
-        .register("eip155:11155111", ExactEvmScheme(testnet_signer))
+        .register("eip155:11155111", testnet_scheme)
     )
 
     print("Registered networks:")
@@ -85,17 +94,17 @@ async def run_builder_pattern_example(
 
     print(f"🌐 Making request to: {url}\n")
 
-    async with x402HttpxClient(client) as http:
+    async with x402HttpxClient(client, transport=transport) as http:
         response = await http.get(url)
-        await response.aread()
+        body = await response.aread()
 
         print(f"Response status: {response.status_code}")
-        print(f"Response body: {response.text}")
+        print(f"Response body: {body.decode('utf-8', 'replace')}")
 
         if response.is_success:
             try:
                 settle_response = http_client.get_payment_settle_response(
-                    lambda name: response.headers.get(name)
+                    response.headers.get
                 )
                 print(
                     f"\n💰 Payment Details: {settle_response.model_dump_json(indent=2)}"
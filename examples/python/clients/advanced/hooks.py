@@ -17,7 +17,7 @@ import asyncio
 import os
 import sys
 
-from dotenv import load_dotenv
+import httpx
 from eth_account import Account
 
 from x402 import x402Client
@@ -32,7 +32,9 @@ from x402.schemas import (
     PaymentCreationFailureContext,
 )
 
-load_dotenv()
+from _env import ensure_env
+
+ensure_env()
 
 
 async def before_payment_creation_hook(
@@ -89,12 +91,17 @@ async def payment_creation_failure_hook(
     return None  # Don't recover, let it fail
 
 
-async def run_hooks_example(private_key: str, url: str) -> None:
+async def run_hooks_example(
+    private_key: str,
+    url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Run the hooks example.
 
     Args:
         private_key: EVM private key for signing.
         url: URL to make the request to.
+        transport: Optional shared httpx transport to send requests through.
     """
     print("🔧 Creating client with payment lifecycle hooks...\n")
 
@@ -115,17 +122,17 @@ async def run_hooks_example(private_key: str, url: str) -> None:
 
     print(f"🌐 Making request to: {url}\n")
 
-    async with x402HttpxClient(client) as http:
+    async with x402HttpxClient(client, transport=transport) as http:
         response = await http.get(url)
-        await response.aread()
+        body = await response.aread()
 
         print(f"Response status: {response.status_code}")
-        print(f"Response body: {response.text}")
+        print(f"Response body: {body.decode('utf-8', 'replace')}")
 
         if response.is_success:
             try:
                 settle_response = http_client.get_payment_settle_response(
-                    lambda name: response.headers.get(name)
+                    response.headers.get
                 )
                 print(
                     f"\n💰 Payment Details: {settle_response.model_dump_json(indent=2)}"
@@ -19,10 +19,15 @@ import asyncio
 import os
 import sys
 
-from dotenv import load_dotenv
+import httpx
+
+from _env import ensure_env
+from builder_pattern import run_builder_pattern_example as _run_builder_pattern
+from hooks import run_hooks_example as _run_hooks
+from preferred_network import run_preferred_network_example as _run_preferred_network
 
 # Load environment variables
-load_dotenv()
+ensure_env()
 
 
 EXAMPLES = {
@@ -53,25 +58,55 @@ def validate_environment() -> tuple[str, str]:
     return private_key, f"{base_url}{endpoint_path}"
 
 
-async def run_hooks_example(private_key: str, url: str) -> None:
-    """Run the hooks example."""
-    from hooks import run_hooks_example
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Transport shared across examples that outlives each example's client.
 
-    await run_hooks_example(private_key, url)
+    Every example closes its own x402HttpxClient, which would otherwise close
+    the pooled connections too. This wrapper ignores those closes so the
+    HTTP/2 connection pool is reused until ``close()`` is called once.
+    """
 
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
 
-async def run_preferred_network_example(private_key: str, url: str) -> None:
-    """Run the preferred network example."""
-    from preferred_network import run_preferred_network_example
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
 
-    await run_preferred_network_example(private_key, url)
+    async def aclose(self) -> None:
+        pass
 
+    async def close(self) -> None:
+        """Close the underlying transport and its connection pool."""
+        await self._transport.aclose()
 
-async def run_builder_pattern_example(private_key: str, url: str) -> None:
-    """Run the builder pattern example."""
-    from builder_pattern import run_builder_pattern_example
 
-    await run_builder_pattern_example(private_key, url)
+async def run_hooks_example(
+    private_key: str,
+    url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
+    """Run the hooks example."""
+    await _run_hooks(private_key, url, transport=transport)
+
+
+async def run_preferred_network_example(
+    private_key: str,
+    url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
+    """Run the preferred network example."""
+    await _run_preferred_network(
+        private_key, os.getenv("SVM_PRIVATE_KEY"), url, transport=transport
+    )
+
+
+async def run_builder_pattern_example(
+    private_key: str,
+    url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
+    """Run the builder pattern example."""
+    await _run_builder_pattern(private_key, url, transport=transport)
 
 
 EXAMPLE_RUNNERS = {
@@ -81,13 +116,19 @@ EXAMPLE_RUNNERS = {
 }
 
 
-async def run_example(name: str, private_key: str, url: str) -> None:
+async def run_example(
+    name: str,
+    private_key: str,
+    url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Run a specific example.
 
     Args:
         name: Name of the example to run.
         private_key: EVM private key for signing.
         url: URL to make the request to.
+        transport: Optional shared httpx transport to send requests through.
     """
     print(f"\n{'=' * 60}")
     print(f"Running: {name}")
@@ -95,22 +136,29 @@ async def run_example(name: str, private_key: str, url: str) -> None:
     print(f"{'=' * 60}\n")
 
     runner = EXAMPLE_RUNNERS[name]
-    await runner(private_key, url)
+    await runner(private_key, url, transport=transport)
 
 
 async def run_all_examples(private_key: str, url: str) -> None:
     """Run all examples sequentially.
 
+    All examples share one pooled HTTP/2 transport, so the connection to the
+    resource server is set up once instead of once per example.
+
     Args:
         private_key: EVM private key for signing.
         url: URL to make the request to.
     """
-    for name in EXAMPLES:
-        try:
-            await run_example(name, private_key, url)
-        except Exception as e:
-            print(f"\n❌ Example '{name}' failed: {e}")
-        print()
+    transport = SharedTransport(httpx.AsyncHTTPTransport(http2=True))
+    try:
+        for name in EXAMPLES:
+            try:
+                await run_example(name, private_key, url, transport=transport)
+            except Exception as e:
+                print(f"\n❌ Example '{name}' failed: {e}")
+            print()
+    finally:
+        await transport.close()
 
 
 def main() -> None:
@@ -15,7 +15,7 @@ import asyncio
 import os
 import sys
 
-from dotenv import load_dotenv
+import httpx
 from eth_account import Account
 
 from x402 import x402Client
@@ -27,7 +27,9 @@ from x402.mechanisms.svm import KeypairSigner, SOLANA_MAINNET_CAIP2, SOLANA_DEVN
 from x402.mechanisms.svm.exact.register import register_exact_svm_client
 from x402.schemas import PaymentRequirements, PaymentRequirementsV1
 
-load_dotenv()
+from _env import ensure_env
+
+ensure_env()
 
 # Type alias for requirements
 RequirementsView = PaymentRequirements | PaymentRequirementsV1
@@ -44,6 +46,21 @@ NETWORK_PREFERENCES = [
     "eip155:84532",  # Base Sepolia (testnet)
 ]
 
+# Rank of each CAIP-2 family (e.g. "eip155", "solana"). An option matches a
+# preference on an exact network match or a shared family prefix, so its rank
+# is the position of the first preference in its family.
+# (Built in reverse so earlier preferences overwrite later ones.)
+FAMILY_RANK: dict[str, int] = {
+    network.split(":", 1)[0]: rank
+    for rank, network in reversed(list(enumerate(NETWORK_PREFERENCES)))
+}
+NO_PREFERENCE = len(NETWORK_PREFERENCES)
+
+
+def preference_rank(option: RequirementsView) -> int:
+    """Return the option's position in NETWORK_PREFERENCES (lower is better)."""
+    return FAMILY_RANK.get(option.network.split(":", 1)[0], NO_PREFERENCE)
+
 
 def preferred_network_selector(
     version: int,
@@ -68,14 +85,11 @@ def preferred_network_selector(
         print(f"   {i + 1}. {opt.network} ({opt.scheme})")
     print()
 
-    # Try each preference in order
-    for preference in NETWORK_PREFERENCES:
-        for opt in options:
-            if opt.network == preference or opt.network.startswith(
-                preference.split(":")[0] + ":"
-            ):
-                print(f"✨ Selected preferred network: {opt.network}")
-                return opt
+    # Best-ranked option; min() keeps the first option among equal ranks
+    best = min(options, key=preference_rank)
+    if preference_rank(best) < NO_PREFERENCE:
+        print(f"✨ Selected preferred network: {best.network}")
+        return best
 
     # Fallback to first mutually-supported option (server's top preference among what we support)
     print(f"⚠️  No preferred network available, falling back to: {options[0].network}")
@@ -86,6 +100,7 @@ async def run_preferred_network_example(
     evm_private_key: str | None,
     svm_private_key: str | None,
     url: str,
+    transport: httpx.AsyncBaseTransport | None = None,
 ) -> None:
     """Run the preferred network example.
 
@@ -93,6 +108,7 @@ async def run_preferred_network_example(
         evm_private_key: EVM private key for signing (optional).
         svm_private_key: Solana private key for signing (optional).
         url: URL to make the request to.
+        transport: Optional shared httpx transport to send requests through.
     """
     if not evm_private_key and not svm_private_key:
         print("Error: At least one of EVM_PRIVATE_KEY or SVM_PRIVATE_KEY is required")
@@ -122,17 +138,17 @@ async def run_preferred_network_example(
 
     print(f"🌐 Making request to: {url}\n")
 
-    async with x402HttpxClient(client) as http:
+    async with x402HttpxClient(client, transport=transport) as http:
         response = await http.get(url)
-        await response.aread()
+        body = await response.aread()
 
         print(f"\nResponse status: {response.status_code}")
-        print(f"Response body: {response.text}")
+        print(f"Response body: {body.decode('utf-8', 'replace')}")
 
         if response.is_success:
             try:
                 settle_response = http_client.get_payment_settle_response(
-                    lambda name: response.headers.get(name)
+                    response.headers.get
                 )
                 print(
                     f"\n💰 Payment Details: {settle_response.model_dump_json(indent=2)}"
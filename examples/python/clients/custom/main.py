@@ -73,7 +73,9 @@ def validate_environment() -> tuple[str | None, str | None, str, str]:
     return evm_private_key, svm_private_key, base_url, endpoint_path
 
 
-async def make_request_with_payment(client: x402Client, url: str) -> None:
+async def make_request_with_payment(
+    client: x402Client, http: httpx.AsyncClient, url: str
+) -> None:
     """
     Makes a request with manual x402 payment handling.
 
@@ -87,78 +89,78 @@ async def make_request_with_payment(client: x402Client, url: str) -> None:
 
     Args:
         client: The x402 client instance configured with payment schemes.
-        url: The URL to request.
+        http: Shared HTTP client; the retry reuses its pooled connection.
+        url: The URL to request, absolute or relative to the base URL of http.
     """
-    print(f"\n  Making initial request to: {url}\n")
-
-    async with httpx.AsyncClient(timeout=30.0) as http:
-        # Step 1: Make initial request (no payment)
-        response = await http.get(url)
-        print(f"  Initial response status: {response.status_code}\n")
-
-        # Step 2: Handle 402 Payment Required
-        if response.status_code == HTTP_STATUS_PAYMENT_REQUIRED:
-            print("  Payment required! Processing...\n")
-
-            # Step 3: Decode payment requirements from PAYMENT-REQUIRED header
-            payment_required_header = response.headers.get(PAYMENT_REQUIRED_HEADER)
-            if not payment_required_header:
-                raise ValueError(f"Missing {PAYMENT_REQUIRED_HEADER} header")
-
-            payment_required: PaymentRequired = decode_payment_required_header(
-                payment_required_header
-            )
-
-            # Display available payment options
-            accepts = payment_required.accepts
-            requirements = accepts if isinstance(accepts, list) else [accepts]
-
-            print("  Payment requirements:")
-            for i, req in enumerate(requirements, 1):
-                print(f"     {i}. {req.network} / {req.scheme} - {req.amount}")
-
-            # Step 4: Create signed payment payload
-            # The client will select the appropriate scheme based on registration
-            print("\n  Creating payment...\n")
-            payment_payload = await client.create_payment_payload(payment_required)
-
-            # Step 5: Encode payment and retry with PAYMENT-SIGNATURE header
-            payment_header = encode_payment_signature_header(payment_payload)
-
-            print("  Retrying with payment...\n")
-            response = await http.get(
-                url,
-                headers={PAYMENT_SIGNATURE_HEADER: payment_header},
+    print(f"\n  Making initial request to: {http.base_url.join(url)}\n")
+
+    # Step 1: Make initial request (no payment)
+    response = await http.get(url)
+    print(f"  Initial response status: {response.status_code}\n")
+
+    # Step 2: Handle 402 Payment Required
+    if response.status_code == HTTP_STATUS_PAYMENT_REQUIRED:
+        print("  Payment required! Processing...\n")
+
+        # Step 3: Decode payment requirements from PAYMENT-REQUIRED header
+        payment_required_header = response.headers.get(PAYMENT_REQUIRED_HEADER)
+        if not payment_required_header:
+            raise ValueError(f"Missing {PAYMENT_REQUIRED_HEADER} header")
+
+        payment_required: PaymentRequired = decode_payment_required_header(
+            payment_required_header
+        )
+
+        # Display available payment options
+        accepts = payment_required.accepts
+        requirements = accepts if isinstance(accepts, list) else [accepts]
+
+        print("  Payment requirements:")
+        for i, req in enumerate(requirements, 1):
+            print(f"     {i}. {req.network} / {req.scheme} - {req.amount}")
+
+        # Step 4: Create signed payment payload
+        # The client will select the appropriate scheme based on registration
+        print("\n  Creating payment...\n")
+        payment_payload = await client.create_payment_payload(payment_required)
+
+        # Step 5: Encode payment and retry with PAYMENT-SIGNATURE header
+        payment_header = encode_payment_signature_header(payment_payload)
+
+        print("  Retrying with payment...\n")
+        response = await http.get(
+            url,
+            headers={PAYMENT_SIGNATURE_HEADER: payment_header},
+        )
+        print(f"  Response status: {response.status_code}\n")
+
+    # Step 6: Handle response
+    if response.status_code == 200:
+        print("  Success!\n")
+        print(f"Response: {response.json()}")
+
+        # Decode settlement confirmation from PAYMENT-RESPONSE header
+        settlement_header = response.headers.get(PAYMENT_RESPONSE_HEADER)
+        if settlement_header:
+            settlement = decode_payment_response_header(settlement_header)
+            print("\n  Settlement:")
+            print(f"     Transaction: {settlement.transaction}")
+            print(f"     Network: {settlement.network}")
+            print(f"     Payer: {settlement.payer}")
+    elif response.status_code == HTTP_STATUS_PAYMENT_REQUIRED:
+        # Payment was rejected (e.g., insufficient balance, invalid signature)
+        print("  Payment rejected!\n")
+        payment_response_header = response.headers.get(PAYMENT_RESPONSE_HEADER)
+        if payment_response_header:
+            payment_response = decode_payment_response_header(
+                payment_response_header
             )
-            print(f"  Response status: {response.status_code}\n")
-
-        # Step 6: Handle response
-        if response.status_code == 200:
-            print("  Success!\n")
-            print(f"Response: {response.json()}")
-
-            # Decode settlement confirmation from PAYMENT-RESPONSE header
-            settlement_header = response.headers.get(PAYMENT_RESPONSE_HEADER)
-            if settlement_header:
-                settlement = decode_payment_response_header(settlement_header)
-                print("\n  Settlement:")
-                print(f"     Transaction: {settlement.transaction}")
-                print(f"     Network: {settlement.network}")
-                print(f"     Payer: {settlement.payer}")
-        elif response.status_code == HTTP_STATUS_PAYMENT_REQUIRED:
-            # Payment was rejected (e.g., insufficient balance, invalid signature)
-            print("  Payment rejected!\n")
-            payment_response_header = response.headers.get(PAYMENT_RESPONSE_HEADER)
-            if payment_response_header:
-                payment_response = decode_payment_response_header(
-                    payment_response_header
-                )
-                print(f"  Error: {payment_response.error_reason}")
-            else:
-                print("  No error details available in response headers.")
-                print(f"  Response body: {response.text}")
+            print(f"  Error: {payment_response.error_reason}")
         else:
-            raise RuntimeError(f"Unexpected status: {response.status_code}")
+            print("  No error details available in response headers.")
+            print(f"  Response body: {response.text}")
+    else:
+        raise RuntimeError(f"Unexpected status: {response.status_code}")
 
 
 async def main() -> None:
@@ -194,9 +196,17 @@ async def main() -> None:
 
     print("  Client ready\n")
 
-    # Build full URL and make request
-    url = f"{base_url}{endpoint_path}"
-    await make_request_with_payment(client, url)
+    # One pooled HTTP/2 client for the whole run: the paid retry goes out on
+    # the connection the initial 402 request already opened.
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+        ),
+    ) as http:
+        await make_request_with_payment(client, http, endpoint_path)
 
     print("\n  Done!")
 
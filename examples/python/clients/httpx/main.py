@@ -4,6 +4,7 @@ import asyncio
 import os
 import sys
 
+import httpx
 from dotenv import load_dotenv
 from eth_account import Account
 
@@ -76,8 +77,16 @@ async def main() -> None:
     url = f"{base_url}{endpoint_path}"
     print(f"Making request to: {url}\n")
 
+    # HTTP/2 transport: the paid retry after a 402 reuses the connection (and
+    # HPACK header table) opened by the initial request
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
+
     # Make request using async context manager
-    async with x402HttpxClient(client) as http:
+    async with x402HttpxClient(client, transport=transport) as http:
         response = await http.get(url)
         await response.aread()
 
@@ -88,7 +97,7 @@ async def main() -> None:
         if response.is_success:
             try:
                 settle_response = http_client.get_payment_settle_response(
-                    lambda name: response.headers.get(name)
+                    response.headers.get
                 )
                 print(
                     f"\nPayment response: {settle_response.model_dump_json(indent=2)}"
@@ -10,23 +10,34 @@ Supports:
 Run with: uvicorn main:app --port 4022
 """
 
+import asyncio
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 from solders.keypair import Keypair
 
-from x402 import x402Facilitator
+from x402 import x402FacilitatorSync
 from x402.mechanisms.evm import FacilitatorWeb3Signer
 from x402.mechanisms.evm.exact import register_exact_evm_facilitator
 from x402.mechanisms.svm import FacilitatorKeypairSigner
 from x402.mechanisms.svm.exact import register_exact_svm_facilitator
+from x402.schemas import PaymentRequirements, parse_payment_payload
 
 # Load environment variables
 load_dotenv()
 
+# Hook output goes through logging so the arguments are only formatted when
+# the level is enabled (LOG_LEVEL=WARNING silences the per-request lines).
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(message)s")
+logger = logging.getLogger("x402.facilitator")
+
 # Configuration
 PORT = int(os.environ.get("PORT", "4022"))
 
@@ -39,10 +50,17 @@ if not os.environ.get("SVM_PRIVATE_KEY"):
     print("❌ SVM_PRIVATE_KEY environment variable is required")
     sys.exit(1)
 
+# Keep-alive RPC session sized for the verify thread pool (urllib3 defaults to 10)
+rpc_session = requests.Session()
+rpc_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+rpc_session.mount("https://", rpc_adapter)
+rpc_session.mount("http://", rpc_adapter)
+
 # Initialize the EVM signer from private key
 evm_signer = FacilitatorWeb3Signer(
     private_key=os.environ["EVM_PRIVATE_KEY"],
     rpc_url=os.environ.get("EVM_RPC_URL", "https://sepolia.base.org"),
+    session=rpc_session,
 )
 print(f"EVM Facilitator account: {evm_signer.get_addresses()[0]}")
 
@@ -52,34 +70,34 @@ svm_signer = FacilitatorKeypairSigner(svm_keypair)
 print(f"SVM Facilitator account: {svm_signer.get_addresses()[0]}")
 
 
-# Async hook functions for the facilitator
-async def before_verify_hook(ctx):
-    print(f"Before verify: {ctx.payment_payload}")
+# Hook functions for the facilitator
+def before_verify_hook(ctx):
+    logger.info("Before verify: %s", ctx.payment_payload)
 
 
-async def after_verify_hook(ctx):
-    print(f"After verify: {ctx.result}")
+def after_verify_hook(ctx):
+    logger.info("After verify: %s", ctx.result)
 
 
-async def verify_failure_hook(ctx):
-    print(f"Verify failure: {ctx.error}")
+def verify_failure_hook(ctx):
+    logger.info("Verify failure: %s", ctx.error)
 
 
-async def before_settle_hook(ctx):
-    print(f"Before settle: {ctx.payment_payload}")
+def before_settle_hook(ctx):
+    logger.info("Before settle: %s", ctx.payment_payload)
 
 
-async def after_settle_hook(ctx):
-    print(f"After settle: {ctx.result}")
+def after_settle_hook(ctx):
+    logger.info("After settle: %s", ctx.result)
 
 
-async def settle_failure_hook(ctx):
-    print(f"Settle failure: {ctx.error}")
+def settle_failure_hook(ctx):
+    logger.info("Settle failure: %s", ctx.error)
 
 
 # Initialize the x402 Facilitator with EVM and SVM support
 facilitator = (
-    x402Facilitator()
+    x402FacilitatorSync()
     .on_before_verify(before_verify_hook)
     .on_after_verify(after_verify_hook)
     .on_verify_failure(verify_failure_hook)
@@ -101,20 +119,28 @@ register_exact_svm_facilitator(
     networks="solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1",  # Devnet
 )
 
+# The signers make blocking RPC calls and sign on the calling thread, so the
+# handlers run verify/settle off the event loop and /health stays responsive.
+# Settlements share one worker thread: they send transactions from a single
+# facilitator key, and running them one at a time keeps nonces in order.
+settle_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settle")
+
 
 # Pydantic models for request/response
+# Requirements are validated into the SDK model by FastAPI itself. The
+# payload stays a dict because parse_payment_payload picks V1/V2 from it.
 class VerifyRequest(BaseModel):
     """Verify endpoint request body."""
 
     paymentPayload: dict
-    paymentRequirements: dict
+    paymentRequirements: PaymentRequirements
 
 
 class SettleRequest(BaseModel):
     """Settle endpoint request body."""
 
     paymentPayload: dict
-    paymentRequirements: dict
+    paymentRequirements: PaymentRequirements
 
 
 # Initialize FastAPI app
@@ -136,14 +162,12 @@ async def verify(request: VerifyRequest):
         VerifyResponse with isValid and payer (if valid) or invalidReason.
     """
     try:
-        from x402.schemas import PaymentRequirements, parse_payment_payload
-
-        # Parse payload (auto-detects V1/V2) and requirements
+        # Parse payload (auto-detects V1/V2)
         payload = parse_payment_payload(request.paymentPayload)
-        requirements = PaymentRequirements.model_validate(request.paymentRequirements)
+        requirements = request.paymentRequirements
 
-        # Verify payment (await async method)
-        response = await facilitator.verify(payload, requirements)
+        # Verify payment off the event loop (signature recovery + RPC reads)
+        response = await asyncio.to_thread(facilitator.verify, payload, requirements)
 
         return {
             "isValid": response.is_valid,
@@ -166,14 +190,14 @@ async def settle(request: SettleRequest):
         SettleResponse with success, transaction, network, and payer.
     """
     try:
-        from x402.schemas import PaymentRequirements, parse_payment_payload
-
-        # Parse payload (auto-detects V1/V2) and requirements
+        # Parse payload (auto-detects V1/V2)
         payload = parse_payment_payload(request.paymentPayload)
-        requirements = PaymentRequirements.model_validate(request.paymentRequirements)
+        requirements = request.paymentRequirements
 
-        # Settle payment (await async method)
-        response = await facilitator.settle(payload, requirements)
+        # Settle payment on the dedicated settle thread
+        response = await asyncio.get_running_loop().run_in_executor(
+            settle_executor, facilitator.settle, payload, requirements
+        )
 
         return {
             "success": response.success,
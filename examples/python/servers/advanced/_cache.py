@@ -0,0 +1,9 @@
+"""Shared response headers for the advanced server examples."""
+
+from fastapi import Response
+
+
+def no_store(response: Response) -> None:
+    """Keep paid responses out of shared caches (CDNs, proxies)."""
+    response.headers["Cache-Control"] = "private, no-store"
+    response.headers["Vary"] = "PAYMENT-SIGNATURE"
@@ -3,7 +3,8 @@
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.extensions.bazaar import (
@@ -18,6 +19,8 @@ from x402.mechanisms.evm.exact import ExactEvmServerScheme
 from x402.schemas import Network
 from x402.server import x402ResourceServer
 
+from _cache import no_store
+
 load_dotenv()
 
 # Config
@@ -38,20 +41,23 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
-server.register(EVM_NETWORK, ExactEvmServerScheme())
+evm_scheme = ExactEvmServerScheme()
+server.register(EVM_NETWORK, evm_scheme)
 server.register_extension(bazaar_resource_server_extension)
 
+WEATHER_PRICE = evm_scheme.parse_price("$0.001", EVM_NETWORK)
+
 routes = {
     "GET /weather": RouteConfig(
         accepts=[
             PaymentOption(
                 scheme="exact",
                 pay_to=EVM_ADDRESS,
-                price="$0.001",
+                price=WEATHER_PRICE,
                 network=EVM_NETWORK,
             ),
         ],
@@ -79,7 +85,7 @@ routes = {
 app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
-@app.get("/weather")
+@app.get("/weather", dependencies=[Depends(no_store)])
 async def get_weather(city: str = "San Francisco") -> WeatherResponse:
     return WeatherResponse(report=WeatherReport(weather="sunny", temperature=70))
 
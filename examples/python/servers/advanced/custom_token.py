@@ -3,7 +3,8 @@
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
@@ -13,6 +14,8 @@ from x402.mechanisms.evm.exact import ExactEvmServerScheme
 from x402.schemas import AssetAmount, Network
 from x402.server import x402ResourceServer
 
+from _cache import no_store
+
 load_dotenv()
 
 # Config
@@ -47,7 +50,7 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
@@ -57,13 +60,16 @@ evm_scheme = ExactEvmServerScheme()
 evm_scheme.register_money_parser(custom_money_parser)
 server.register(EVM_NETWORK, evm_scheme)
 
+# Parsed once at startup, through the custom parser above
+WEATHER_PRICE = evm_scheme.parse_price("$0.001", EVM_NETWORK)
+
 routes = {
     "GET /weather": RouteConfig(
         accepts=[
             PaymentOption(
                 scheme="exact",
                 pay_to=EVM_ADDRESS,
-                price="$0.001",
+                price=WEATHER_PRICE,
                 network=EVM_NETWORK,
             ),
         ],
@@ -72,7 +78,7 @@ routes = {
 app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
-@app.get("/weather")
+@app.get("/weather", dependencies=[Depends(no_store)])
 async def get_weather(city: str = "San Francisco") -> WeatherResponse:
     return WeatherResponse(report=WeatherReport(weather="sunny", temperature=70))
 
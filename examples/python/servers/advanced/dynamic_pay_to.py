@@ -1,9 +1,11 @@
 """Dynamic pay-to routing example."""
 
+import logging
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
@@ -13,6 +15,8 @@ from x402.mechanisms.evm.exact import ExactEvmServerScheme
 from x402.schemas import Network
 from x402.server import x402ResourceServer
 
+from _cache import no_store
+
 load_dotenv()
 
 # Config
@@ -47,18 +51,26 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
-server.register(EVM_NETWORK, ExactEvmServerScheme())
+evm_scheme = ExactEvmServerScheme()
+server.register(EVM_NETWORK, evm_scheme)
+
+WEATHER_PRICE = evm_scheme.parse_price("$0.001", EVM_NETWORK)
 
 
 # Register hooks to log selected payment option
 async def after_verify(ctx):
-    print("\n=== Dynamic Pay-To - After verify ===")
-    print(f"Pay to: {ctx.requirements.pay_to}")
-    print(f"Payer: {ctx.result.payer}")
+    logger.info(
+        "\n=== Dynamic Pay-To - After verify ===\nPay to: %s\nPayer: %s",
+        ctx.requirements.pay_to,
+        ctx.result.payer,
+    )
 
 
 server.on_after_verify(after_verify)
@@ -69,7 +81,7 @@ routes = {
             PaymentOption(
                 scheme="exact",
                 pay_to=get_dynamic_pay_to,
-                price="$0.001",
+                price=WEATHER_PRICE,
                 network=EVM_NETWORK,
             ),
         ],
@@ -78,7 +90,7 @@ routes = {
 app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
-@app.get("/weather")
+@app.get("/weather", dependencies=[Depends(no_store)])
 async def get_weather(city: str = "San Francisco", country: str = "US") -> WeatherResponse:
     return WeatherResponse(report=WeatherReport(weather="sunny", temperature=70))
 
@@ -1,18 +1,22 @@
 """Dynamic pricing example."""
 
+import logging
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
 from x402.http.middleware.fastapi import PaymentMiddlewareASGI
 from x402.http.types import HTTPRequestContext, RouteConfig
 from x402.mechanisms.evm.exact import ExactEvmServerScheme
-from x402.schemas import Network
+from x402.schemas import AssetAmount, Network
 from x402.server import x402ResourceServer
 
+from _cache import no_store
+
 load_dotenv()
 
 # Config
@@ -24,10 +28,19 @@ if not EVM_ADDRESS:
     raise ValueError("Missing required EVM_ADDRESS environment variable")
 
 
-def get_dynamic_price(context: HTTPRequestContext) -> str:
+evm_scheme = ExactEvmServerScheme()
+
+# Price per tier; any other tier pays the standard price
+TIER_PRICES: dict[str, AssetAmount] = {
+    tier: evm_scheme.parse_price(price, EVM_NETWORK)
+    for tier, price in {"standard": "$0.001", "premium": "$0.005"}.items()
+}
+
+
+def get_dynamic_price(context: HTTPRequestContext) -> AssetAmount:
     """Get dynamic price based on tier query parameter."""
-    tier = context.adapter.get_query_param("tier") or "standard"
-    return "$0.005" if tier == "premium" else "$0.001"
+    tier = context.adapter.get_query_param("tier")
+    return TIER_PRICES.get(tier, TIER_PRICES["standard"])
 
 
 class WeatherReport(BaseModel):
@@ -39,18 +52,23 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
-server.register(EVM_NETWORK, ExactEvmServerScheme())
+server.register(EVM_NETWORK, evm_scheme)
 
 
 # Register hooks to log selected payment option
 async def after_verify(ctx):
-    print("\n=== Dynamic Price - After verify ===")
-    print(f"Amount: {ctx.requirements.amount}")
-    print(f"Payer: {ctx.result.payer}")
+    logger.info(
+        "\n=== Dynamic Price - After verify ===\nAmount: %s\nPayer: %s",
+        ctx.requirements.amount,
+        ctx.result.payer,
+    )
 
 
 server.on_after_verify(after_verify)
@@ -70,7 +88,7 @@ routes = {
 app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
-@app.get("/weather")
+@app.get("/weather", dependencies=[Depends(no_store)])
 async def get_weather(city: str = "San Francisco", tier: str = "standard") -> WeatherResponse:
     return WeatherResponse(report=WeatherReport(weather="sunny", temperature=70))
 
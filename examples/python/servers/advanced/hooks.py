@@ -1,10 +1,11 @@
 """Server lifecycle hooks example."""
 
+import logging
 import os
-from pprint import pprint
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
@@ -34,42 +35,45 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
 server.register(EVM_NETWORK, ExactEvmServerScheme())
 
+# LOG_LEVEL=DEBUG also dumps each hook context; at INFO only the event is logged
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def log_hook(event: str, ctx) -> None:
+    logger.info("=== %s ===", event)
+    logger.debug("%r", ctx)  # formatted lazily, only when DEBUG is enabled
+
 
 # Register async hooks
 async def before_verify(ctx):
-    print("\n=== Before verify ===")
-    pprint(vars(ctx))
+    log_hook("Before verify", ctx)
 
 
 async def after_verify(ctx):
-    print("\n=== After verify ===")
-    pprint(vars(ctx))
+    log_hook("After verify", ctx)
 
 
 async def verify_failure(ctx):
-    print("\n=== Verify failure ===")
-    pprint(vars(ctx))
+    log_hook("Verify failure", ctx)
 
 
 async def before_settle(ctx):
-    print("\n=== Before settle ===")
-    pprint(vars(ctx))
+    log_hook("Before settle", ctx)
 
 
 async def after_settle(ctx):
-    print("\n=== After settle ===")
-    pprint(vars(ctx))
+    log_hook("After settle", ctx)
 
 
 async def settle_failure(ctx):
-    print("\n=== Settle failure ===")
-    pprint(vars(ctx))
+    log_hook("Settle failure", ctx)
 
 
 server.on_before_verify(before_verify)
@@ -95,7 +99,7 @@ app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
 @app.get("/weather")
-async def get_weather(city: str = "San Francisco") -> WeatherResponse:
+async def get_weather() -> WeatherResponse:
     return WeatherResponse(report=WeatherReport(weather="sunny", temperature=70))
 
 
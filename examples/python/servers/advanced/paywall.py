@@ -3,7 +3,8 @@
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
@@ -41,7 +42,7 @@ class PremiumContentResponse(BaseModel):
     content: str
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
@@ -108,9 +109,12 @@ app.add_middleware(
 )
 
 
+HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "ok"}
+async def health_check() -> Response:
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/weather")
@@ -22,6 +22,7 @@ import json
 import os
 import sys
 from dataclasses import dataclass, field
+from datetime import datetime
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, Response
@@ -211,17 +212,9 @@ async def custom_payment_middleware(request: Request, call_next) -> Response:
                     json.dumps(settle_result.model_dump(by_alias=True)).encode()
                 ).decode()
 
-                # Create new response with settlement header
-                body = b""
-                async for chunk in response.body_iterator:
-                    body += chunk
-
-                return Response(
-                    content=body,
-                    status_code=response.status_code,
-                    headers={**dict(response.headers), "PAYMENT-RESPONSE": settlement_header},
-                    media_type=response.media_type,
-                )
+                # Headers can be set until the response is sent; the body keeps streaming
+                response.headers["PAYMENT-RESPONSE"] = settlement_header
+                return response
 
             except Exception as e:
                 print(f"❌ Settlement failed: {e}")
@@ -248,21 +241,21 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok", "version": "2.0.0"}
 
 
+WEATHER_DATA = {
+    "San Francisco": {"weather": "foggy", "temperature": 60},
+    "New York": {"weather": "cloudy", "temperature": 55},
+    "London": {"weather": "rainy", "temperature": 50},
+    "Tokyo": {"weather": "clear", "temperature": 65},
+}
+DEFAULT_WEATHER = {"weather": "sunny", "temperature": 70}
+
+
 @app.get("/weather")
 async def get_weather(city: str = "San Francisco") -> dict:
     """Protected weather endpoint (requires payment)."""
     print("🌤️  Executing weather endpoint handler")
 
-    weather_data = {
-        "San Francisco": {"weather": "foggy", "temperature": 60},
-        "New York": {"weather": "cloudy", "temperature": 55},
-        "London": {"weather": "rainy", "temperature": 50},
-        "Tokyo": {"weather": "clear", "temperature": 65},
-    }
-
-    data = weather_data.get(city, {"weather": "sunny", "temperature": 70})
-
-    from datetime import datetime
+    data = WEATHER_DATA.get(city, DEFAULT_WEATHER)
 
     return {
         "city": city,
@@ -0,0 +1,10 @@
+#!/bin/bash
+# Multi-process deployment: one uvicorn worker per core behind gunicorn.
+# For local development use `uv run python main.py` instead.
+# gunicorn's --worker-connections does not apply to uvicorn workers; to cap
+# in-flight requests per worker, run `uvicorn main:app --workers N
+# --limit-concurrency 1000` instead.
+uv run --with gunicorn --with uvicorn-worker gunicorn main:app \
+  --workers="${WORKERS:-$(nproc)}" \
+  --worker-class=uvicorn_worker.UvicornWorker \
+  --bind=0.0.0.0:4021
@@ -1,7 +1,8 @@
 import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
@@ -40,7 +41,7 @@ class PremiumContentResponse(BaseModel):
 
 
 # App
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 # x402 Middleware
@@ -98,9 +99,12 @@ app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
 
 
 # Routes
+HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "ok"}
+async def health_check() -> Response:
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/weather")
@@ -1,7 +1,9 @@
 import os
 
+import orjson
 from dotenv import load_dotenv
 from flask import Flask, jsonify
+from flask.json.provider import JSONProvider
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClientSync, PaymentOption
 from x402.http.middleware.flask import payment_middleware
@@ -24,8 +26,19 @@ if not EVM_ADDRESS or not SVM_ADDRESS:
     raise ValueError("Missing required environment variables")
 
 
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # App
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 
 # x402 Middleware
@@ -80,9 +93,12 @@ payment_middleware(app, routes=routes, server=server)
 
 
 # Routes
+HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.route("/health")
 def health_check():
-    return jsonify({"status": "ok"})
+    return app.response_class(HEALTH_BODY, mimetype="application/json")
 
 
 @app.route("/weather")
@@ -314,14 +314,16 @@ class x402HttpxClient(httpx.AsyncClient):
     def __init__(
         self,
         x402_client: x402Client | x402HTTPClient,
+        transport: AsyncBaseTransport | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize payment-enabled httpx client.
 
         Args:
             x402_client: x402Client or x402HTTPClient for payments.
+            transport: Optional underlying transport. If None, uses httpx default.
             **kwargs: Additional arguments for httpx.AsyncClient.
         """
-        # Create payment transport
-        transport = x402AsyncTransport(x402_client)
-        super().__init__(transport=transport, **kwargs)
+        # Create payment transport around the (optional) inner transport
+        payment_transport = x402AsyncTransport(x402_client, transport)
+        super().__init__(transport=payment_transport, **kwargs)
@@ -70,14 +70,14 @@ class HTTPFacilitatorClient(HTTPFacilitatorClientBase):
         import httpx
 
         # Create temporary sync client for initialization
-        return httpx.Client(timeout=self._timeout, follow_redirects=True)
+        return httpx.Client(**self._client_kwargs(sync=True))
 
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._http_client is None:
             import httpx
 
-            self._http_client = httpx.AsyncClient(timeout=self._timeout, follow_redirects=True)
+            self._http_client = httpx.AsyncClient(**self._client_kwargs())
         return self._http_client
 
     async def aclose(self) -> None:
@@ -295,7 +295,7 @@ class HTTPFacilitatorClientSync(HTTPFacilitatorClientBase):
         if self._http_client is None:
             import httpx
 
-            self._http_client = httpx.Client(timeout=self._timeout, follow_redirects=True)
+            self._http_client = httpx.Client(**self._client_kwargs(sync=True))
         return self._http_client
 
     def close(self) -> None:
@@ -133,6 +133,17 @@ class FacilitatorConfig:
     http_client: Any = None  # Optional httpx.Client or httpx.AsyncClient
     auth_provider: AuthProvider | None = None
     identifier: str | None = None
+    # Connection pool limits for the owned client (ignored if http_client is set)
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+    # Opt in to multiplexing verify/settle over one HTTP/2 connection; needs the
+    # h2 package (pip install x402[httpx])
+    http2: bool = False
+    # Unix domain socket to connect through instead of TCP, e.g. a local proxy
+    # shared by all workers that keeps one pool to the facilitator. The url host
+    # is still sent as the Host header.
+    uds: str | None = None
 
 
 # ============================================================================
@@ -156,6 +167,14 @@ class HTTPFacilitatorClientBase:
             self._identifier = self._url
             self._http_client = None
             self._owns_client = True
+            defaults = FacilitatorConfig()
+            self._max_connections = config.get("max_connections", defaults.max_connections)
+            self._max_keepalive_connections = config.get(
+                "max_keepalive_connections", defaults.max_keepalive_connections
+            )
+            self._keepalive_expiry = config.get("keepalive_expiry", defaults.keepalive_expiry)
+            self._http2 = config.get("http2", defaults.http2)
+            self._uds = config.get("uds", defaults.uds)
         else:
             config = config or FacilitatorConfig()
 
@@ -165,6 +184,11 @@ class HTTPFacilitatorClientBase:
             self._identifier = config.identifier or self._url
             self._http_client = config.http_client
             self._owns_client = config.http_client is None
+            self._max_connections = config.max_connections
+            self._max_keepalive_connections = config.max_keepalive_connections
+            self._keepalive_expiry = config.keepalive_expiry
+            self._http2 = config.http2
+            self._uds = config.uds
 
     @property
     def url(self) -> str:
@@ -176,6 +200,32 @@ class HTTPFacilitatorClientBase:
         """Get facilitator identifier."""
         return self._identifier
 
+    def _client_kwargs(self, *, sync: bool = False) -> dict[str, Any]:
+        """Keyword arguments for constructing an owned httpx client.
+
+        Args:
+            sync: Build for httpx.Client rather than httpx.AsyncClient.
+        """
+        import httpx
+
+        kwargs: dict[str, Any] = {
+            "timeout": self._timeout,
+            "follow_redirects": True,
+            "http2": self._http2,
+            "limits": httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        }
+        if self._uds:
+            # A custom transport ignores client-level http2/limits, so pass them through
+            transport_cls = httpx.HTTPTransport if sync else httpx.AsyncHTTPTransport
+            kwargs["transport"] = transport_cls(
+                uds=self._uds, http2=kwargs["http2"], limits=kwargs["limits"]
+            )
+        return kwargs
+
     @staticmethod
     def _to_json_safe(obj: Any) -> Any:
         """Convert object to JSON-safe format (handles bigints)."""
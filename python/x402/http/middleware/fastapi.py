@@ -232,10 +232,12 @@ def payment_middleware(
             }
         }
 
-        # Add middleware
+        # Create middleware once, then add it
+        x402_mw = fastapi_payment_middleware(routes, server)
+
         @app.middleware("http")
         async def x402_middleware(request, call_next):
-            return await fastapi_payment_middleware(routes, server)(request, call_next)
+            return await x402_mw(request, call_next)
         ```
     """
     # Auto-register bazaar extension if routes declare it
@@ -11,7 +11,8 @@ from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any
 
 try:
-    from flask import Flask, Request, g, request
+    from flask import Flask, Request, g
+    from flask.ctx import RequestContext
 except ImportError as e:
     raise ImportError(
         "Flask middleware requires the flask package. Install with: uv add x402[flask]"
@@ -342,22 +343,29 @@ class PaymentMiddleware:
         Returns:
             Response body iterator.
         """
-        with self._app.request_context(environ):
-            # Create adapter and context
-            adapter = FlaskAdapter(request)
+        # Check if route requires payment before pushing a request context,
+        # so unprotected routes go straight to the app
+        route_request = self._app.request_class(environ)
+        adapter = FlaskAdapter(route_request)
+        route_context = HTTPRequestContext(
+            adapter=adapter,
+            path=route_request.path,
+            method=route_request.method,
+        )
+        if not self._http_server.requires_payment(route_context):
+            return self._original_wsgi(environ, start_response)
+
+        # Reuse the request built for the route check instead of parsing environ again
+        with RequestContext(self._app, environ, request=route_request):
             context = HTTPRequestContext(
                 adapter=adapter,
-                path=request.path,
-                method=request.method,
+                path=route_request.path,
+                method=route_request.method,
                 payment_header=(
                     adapter.get_header("payment-signature") or adapter.get_header("x-payment")
                 ),
             )
 
-            # Check if route requires payment
-            if not self._http_server.requires_payment(context):
-                return self._original_wsgi(environ, start_response)
-
             # Initialize on first protected request
             if self._sync_on_start and not self._init_done:
                 self._http_server.initialize()
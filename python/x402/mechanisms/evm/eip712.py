@@ -1,5 +1,6 @@
 """EIP-712 typed data hashing utilities."""
 
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -133,11 +134,19 @@ def hash_domain(domain: TypedDataDomain) -> bytes:
     Returns:
         32-byte domain separator hash.
     """
+    return _hash_domain_cached(
+        domain.name, domain.version, domain.chain_id, domain.verifying_contract
+    )
+
+
+@lru_cache(maxsize=256)
+def _hash_domain_cached(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    """Domain separator hash, memoized per token and chain."""
     domain_data = {
-        "name": domain.name,
-        "version": domain.version,
-        "chainId": domain.chain_id,
-        "verifyingContract": domain.verifying_contract,
+        "name": name,
+        "version": version,
+        "chainId": chain_id,
+        "verifyingContract": verifying_contract,
     }
     return hash_struct("EIP712Domain", DOMAIN_TYPES, domain_data)
 
@@ -155,12 +155,16 @@ class FacilitatorWeb3Signer:
         self,
         private_key: str,
         rpc_url: str,
+        session: Any = None,
     ) -> None:
         """Initialize signer with private key and RPC connection.
 
         Args:
             private_key: Hex private key with or without 0x prefix.
             rpc_url: Ethereum RPC endpoint URL.
+            session: Optional requests.Session for RPC calls, e.g. one with a
+                larger connection pool for concurrent verifies. If None,
+                web3.py manages its own session.
 
         """
         # Normalize private key format
@@ -168,7 +172,7 @@ class FacilitatorWeb3Signer:
             private_key = "0x" + private_key
 
         self._account = Account.from_key(private_key)
-        self._w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self._w3 = Web3(Web3.HTTPProvider(rpc_url, session=session))
 
         # Add PoA middleware for testnets (Base, Polygon, etc.)
         self._w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
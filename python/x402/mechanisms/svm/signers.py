@@ -38,6 +38,8 @@ class KeypairSigner:
             keypair: Solders Keypair instance.
         """
         self._keypair = keypair
+        # Base58-encode the public key once; it is read on every payment.
+        self._address = str(keypair.pubkey())
 
     @property
     def address(self) -> str:
@@ -46,7 +48,7 @@ class KeypairSigner:
         Returns:
             Base58 encoded public key.
         """
-        return str(self._keypair.pubkey())
+        return self._address
 
     @property
     def keypair(self) -> Keypair:
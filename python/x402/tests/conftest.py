@@ -3,6 +3,7 @@
 This file is automatically loaded by pytest before running tests.
 """
 
+import asyncio
 import os
 from pathlib import Path
 
@@ -20,6 +21,15 @@ def pytest_configure(config):
             _load_dotenv(env_path)
             break
 
+    # Opt-in: run event loops created by the tests on uvloop (not on Windows)
+    if os.environ.get("X402_TEST_UVLOOP") == "1":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 def _load_dotenv(path: Path) -> None:
     """Load environment variables from a .env file.
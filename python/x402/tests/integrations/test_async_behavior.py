@@ -83,20 +83,31 @@ class MockHTTPAdapter:
 class TestAsyncHTTPHooks:
     """Tests for async HTTP hooks - async-only behavior."""
 
-    def setup_method(self) -> None:
-        """Set up async test fixtures."""
-        self.facilitator = x402Facilitator().register(["x402:cash"], CashSchemeNetworkFacilitator())
-        facilitator_client = CashFacilitatorClient(self.facilitator)
-        self.resource_server = x402ResourceServer(facilitator_client)
-        self.resource_server.register("x402:cash", CashSchemeNetworkServer())
-        self.resource_server.initialize()
+    @classmethod
+    def setup_class(cls) -> None:
+        """Set up async test fixtures and an event loop shared by the class.
+
+        Tests only layer new x402HTTPResourceServer instances on top of the
+        shared resource server, so it is built and initialized once.
+        """
+        cls.loop = asyncio.new_event_loop()
+        cls.facilitator = x402Facilitator().register(["x402:cash"], CashSchemeNetworkFacilitator())
+        facilitator_client = CashFacilitatorClient(cls.facilitator)
+        cls.resource_server = x402ResourceServer(facilitator_client)
+        cls.resource_server.register("x402:cash", CashSchemeNetworkServer())
+        cls.resource_server.initialize()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """Close the shared event loop."""
+        cls.loop.close()
 
     def test_async_price_hook_performs_actual_async_work(self) -> None:
         """Test that price hook can perform truly asynchronous operations."""
 
         async def slow_price(context: HTTPRequestContext) -> str:
             # Simulate async operation (e.g., fetch from external service)
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0)  # Yield to the event loop
             return "$5.00"
 
         routes = {
@@ -114,7 +125,7 @@ class TestAsyncHTTPHooks:
             adapter=MockHTTPAdapter(path="/test"), path="/test", method="GET"
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         payment_required = decode_payment_required_header(
             result.response.headers["PAYMENT-REQUIRED"]
@@ -124,8 +135,16 @@ class TestAsyncHTTPHooks:
     def test_hook_timeout_configured_per_route(self) -> None:
         """Test that slow hooks are timed out when timeout is configured."""
 
+        cancelled = False
+
         async def infinite_loop_hook(context: HTTPRequestContext) -> str:
-            await asyncio.sleep(10)  # Much longer than configured timeout
+            nonlocal cancelled
+            try:
+                # Never completes, so the timeout's cancellation is the only exit
+                await asyncio.get_running_loop().create_future()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
             return "$1.00"
 
         routes = {
@@ -136,7 +155,7 @@ class TestAsyncHTTPHooks:
                     "payTo": "m@e.com",
                     "price": infinite_loop_hook,
                 },
-                "hook_timeout_seconds": 0.5,  # Explicit timeout
+                "hook_timeout_seconds": 0.05,  # Explicit timeout
             }
         }
         http_server = x402HTTPResourceServer(self.resource_server, routes)
@@ -144,10 +163,11 @@ class TestAsyncHTTPHooks:
             adapter=MockHTTPAdapter(path="/timeout"), path="/timeout", method="GET"
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         assert result.response.status == 500
         assert "timed out" in result.response.body["error"].lower()
+        assert cancelled is True
 
     def test_custom_timeout_shorter_than_hook(self) -> None:
         """Test custom timeout causes hook to fail when hook is slower."""
@@ -164,7 +184,7 @@ class TestAsyncHTTPHooks:
                     "payTo": "m@e.com",
                     "price": slow_hook,
                 },
-                "hook_timeout_seconds": 0.2,  # Shorter than hook duration
+                "hook_timeout_seconds": 0.05,  # Shorter than hook duration
             }
         }
         http_server = x402HTTPResourceServer(self.resource_server, routes)
@@ -174,7 +194,7 @@ class TestAsyncHTTPHooks:
             method="GET",
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         assert result.response.status == 500
         assert "timed out" in result.response.body["error"].lower()
@@ -203,7 +223,7 @@ class TestAsyncHTTPHooks:
             adapter=MockHTTPAdapter(path="/sync"), path="/sync", method="GET"
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         payment_required = decode_payment_required_header(
             result.response.headers["PAYMENT-REQUIRED"]
@@ -215,7 +235,7 @@ class TestAsyncHTTPHooks:
         """Test mixing sync and async hooks in the same route."""
 
         async def async_price(context: HTTPRequestContext) -> str:
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(0)
             return "$2.50"
 
         def sync_pay_to(context: HTTPRequestContext) -> str:
@@ -236,7 +256,7 @@ class TestAsyncHTTPHooks:
             adapter=MockHTTPAdapter(path="/mixed"), path="/mixed", method="GET"
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         payment_required = decode_payment_required_header(
             result.response.headers["PAYMENT-REQUIRED"]
@@ -248,7 +268,7 @@ class TestAsyncHTTPHooks:
         """Test that hooks raising exceptions are handled gracefully."""
 
         async def failing_hook(context: HTTPRequestContext) -> str:
-            await asyncio.sleep(0.01)  # Some async work first
+            await asyncio.sleep(0)  # Some async work first
             raise ValueError("Intentional error for testing")
 
         routes = {
@@ -266,7 +286,7 @@ class TestAsyncHTTPHooks:
             adapter=MockHTTPAdapter(path="/error"), path="/error", method="GET"
         )
 
-        result = asyncio.run(http_server.process_http_request(context))
+        result = self.loop.run_until_complete(http_server.process_http_request(context))
         assert result.type == "payment-error"
         assert result.response.status == 500
         # Error message should be sanitized (not expose internal details)
@@ -281,13 +301,14 @@ class TestAsyncHTTPHooks:
 class TestAsyncClientHooks:
     """Tests for async hooks in x402Client."""
 
-    def setup_method(self) -> None:
-        """Set up async test fixtures."""
-        self.facilitator = x402Facilitator().register(["x402:cash"], CashSchemeNetworkFacilitator())
-        facilitator_client = CashFacilitatorClient(self.facilitator)
-        self.server = x402ResourceServer(facilitator_client)
-        self.server.register("x402:cash", CashSchemeNetworkServer())
-        self.server.initialize()
+    @classmethod
+    def setup_class(cls) -> None:
+        """Set up async test fixtures (shared; tests build their own clients)."""
+        cls.facilitator = x402Facilitator().register(["x402:cash"], CashSchemeNetworkFacilitator())
+        facilitator_client = CashFacilitatorClient(cls.facilitator)
+        cls.server = x402ResourceServer(facilitator_client)
+        cls.server.register("x402:cash", CashSchemeNetworkServer())
+        cls.server.initialize()
 
     @pytest.mark.asyncio
     async def test_async_after_payment_creation_hook(self) -> None:
@@ -298,7 +319,7 @@ class TestAsyncClientHooks:
         async def async_after_hook(context) -> None:
             nonlocal hook_called, hook_delay_completed
             hook_called = True
-            await asyncio.sleep(0.1)  # Simulate async work
+            await asyncio.sleep(0)  # Simulate async work (yields to the loop)
             hook_delay_completed = True
 
         client = (
@@ -346,23 +367,24 @@ class TestAsyncClientHooks:
 class TestAsyncPaymentFlow:
     """Tests for async payment flow using pytest.mark.asyncio."""
 
-    def setup_method(self) -> None:
-        """Set up async test fixtures."""
-        self.client = x402Client().register(
+    @classmethod
+    def setup_class(cls) -> None:
+        """Set up async test fixtures (shared; no test registers hooks on them)."""
+        cls.client = x402Client().register(
             "x402:cash",
             CashSchemeNetworkClient("John"),
         )
 
-        self.facilitator = x402Facilitator().register(
+        cls.facilitator = x402Facilitator().register(
             ["x402:cash"],
             CashSchemeNetworkFacilitator(),
         )
 
-        facilitator_client = CashFacilitatorClient(self.facilitator)
+        facilitator_client = CashFacilitatorClient(cls.facilitator)
 
-        self.server = x402ResourceServer(facilitator_client)
-        self.server.register("x402:cash", CashSchemeNetworkServer())
-        self.server.initialize()
+        cls.server = x402ResourceServer(facilitator_client)
+        cls.server.register("x402:cash", CashSchemeNetworkServer())
+        cls.server.initialize()
 
     @pytest.mark.asyncio
     async def test_async_payment_flow_native_await(self) -> None:
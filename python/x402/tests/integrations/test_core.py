@@ -11,8 +11,9 @@ separately in test_async_behavior.py.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Coroutine, Iterator
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import pytest
 
@@ -46,6 +47,8 @@ from ..mocks import (
 if TYPE_CHECKING:
     from x402.schemas import PaymentPayloadV1, PaymentRequiredV1
 
+T = TypeVar("T")
+
 
 # =============================================================================
 # Test Fixture Wrappers
@@ -61,6 +64,12 @@ class ComponentsFixture:
     facilitator: x402Facilitator | x402FacilitatorSync
     server: x402ResourceServer | x402ResourceServerSync
     is_async: bool
+    loop: asyncio.AbstractEventLoop | None = None
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the fixture's event loop (reused across calls)."""
+        assert self.loop is not None
+        return self.loop.run_until_complete(coro)
 
     def create_payment_payload(
         self,
@@ -68,7 +77,7 @@ class ComponentsFixture:
     ) -> PaymentPayload | PaymentPayloadV1:
         """Create payment payload, handling sync/async uniformly."""
         if self.is_async:
-            return asyncio.run(
+            return self._run(
                 self.client.create_payment_payload(payment_required)  # type: ignore
             )
         return self.client.create_payment_payload(payment_required)  # type: ignore
@@ -80,7 +89,7 @@ class ComponentsFixture:
     ) -> VerifyResponse:
         """Verify payment, handling sync/async uniformly."""
         if self.is_async:
-            return asyncio.run(
+            return self._run(
                 self.server.verify_payment(payload, requirements)  # type: ignore
             )
         return self.server.verify_payment(payload, requirements)  # type: ignore
@@ -92,7 +101,7 @@ class ComponentsFixture:
     ) -> SettleResponse:
         """Settle payment, handling sync/async uniformly."""
         if self.is_async:
-            return asyncio.run(
+            return self._run(
                 self.server.settle_payment(payload, requirements)  # type: ignore
             )
         return self.server.settle_payment(payload, requirements)  # type: ignore
@@ -104,7 +113,7 @@ class ComponentsFixture:
     ) -> VerifyResponse:
         """Verify via facilitator directly."""
         if self.is_async:
-            return asyncio.run(
+            return self._run(
                 self.facilitator.verify(payload, requirements)  # type: ignore
             )
         return self.facilitator.verify(payload, requirements)  # type: ignore
@@ -116,7 +125,7 @@ class ComponentsFixture:
     ) -> SettleResponse:
         """Settle via facilitator directly."""
         if self.is_async:
-            return asyncio.run(
+            return self._run(
                 self.facilitator.settle(payload, requirements)  # type: ignore
             )
         return self.facilitator.settle(payload, requirements)  # type: ignore
@@ -169,15 +178,20 @@ def _create_async_components() -> ComponentsFixture:
         facilitator=facilitator,
         server=server,
         is_async=True,
+        loop=asyncio.new_event_loop(),
     )
 
 
 @pytest.fixture(params=["sync", "async"])
-def components(request: pytest.FixtureRequest) -> ComponentsFixture:
+def components(request: pytest.FixtureRequest) -> Iterator[ComponentsFixture]:
     """Fixture that provides both sync and async component sets."""
     if request.param == "sync":
-        return _create_sync_components()
-    return _create_async_components()
+        yield _create_sync_components()
+        return
+
+    fixture = _create_async_components()
+    yield fixture
+    fixture.loop.close()  # type: ignore[union-attr]
 
 
 # =============================================================================
@@ -392,7 +406,7 @@ class TestClientPolicies:
         payment_required = components.server.create_payment_required_response(accepts)
 
         if components.is_async:
-            payload = asyncio.run(
+            payload = components._run(
                 client.create_payment_payload(payment_required)  # type: ignore
             )
         else:
@@ -433,7 +447,7 @@ class TestSyncHooks:
         payment_required = components.server.create_payment_required_response(accepts)
 
         if components.is_async:
-            payload = asyncio.run(
+            payload = components._run(
                 client.create_payment_payload(payment_required)  # type: ignore
             )
         else:
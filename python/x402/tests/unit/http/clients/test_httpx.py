@@ -343,6 +343,15 @@ class TestX402HttpxClient:
 
         assert client.timeout.connect == 60.0
 
+    def test_wraps_provided_transport(self):
+        """Test that a provided transport is used as the inner transport."""
+        mock_client = MockX402Client()
+        inner = httpx.AsyncHTTPTransport()
+        client = x402HttpxClient(mock_client, transport=inner)
+
+        assert isinstance(client._transport, x402AsyncTransport)
+        assert client._transport._transport is inner
+
 
 # =============================================================================
 # Error Class Tests
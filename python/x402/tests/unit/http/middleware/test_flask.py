@@ -432,6 +432,39 @@ class TestFlaskMiddlewareIntegration:
                 assert response.status_code == 200
                 assert response.data == b"Public content"
 
+    def test_non_protected_route_check_uses_real_adapter(self):
+        """Test that the route check gets a working adapter before the request context."""
+        app = Flask(__name__)
+
+        @app.route("/health")
+        def health():
+            return "ok"
+
+        routes = {
+            "GET /api/protected": RouteConfig(
+                accepts=PaymentOption(
+                    scheme="exact",
+                    pay_to="0x1234567890123456789012345678901234567890",
+                    price="$0.01",
+                    network="eip155:8453",
+                ),
+            )
+        }
+
+        middleware = PaymentMiddleware(app, routes, MagicMock(), sync_facilitator_on_start=False)
+        requires_payment = MagicMock(return_value=False)
+        middleware._http_server.requires_payment = requires_payment
+
+        with app.test_client() as client:
+            response = client.get("/health?country=US")
+
+        assert response.status_code == 200
+        assert response.data == b"ok"
+        context = requires_payment.call_args.args[0]
+        assert context.path == "/health"
+        assert context.method == "GET"
+        assert context.adapter.get_query_param("country") == "US"
+
     def test_protected_route_returns_402_without_payment(self):
         """Test that protected routes return 402 without payment."""
         app = Flask(__name__)
@@ -473,6 +506,46 @@ class TestFlaskMiddlewareIntegration:
                 response = client.get("/api/protected")
                 assert response.status_code == 402
 
+    def test_protected_route_builds_request_once(self):
+        """Test that the payment flow reuses the request built for the route check."""
+        app = Flask(__name__)
+        built: list[Any] = []
+
+        class CountingRequest(app.request_class):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                built.append(self)
+
+        app.request_class = CountingRequest
+
+        @app.route("/api/protected")
+        def protected_route():
+            return "Protected content"
+
+        with patch("x402.http.middleware.flask.x402HTTPResourceServerSync") as mock_http_server:
+            mock_http_server_instance = MagicMock()
+            mock_http_server_instance.requires_payment.return_value = True
+            mock_http_server_instance.process_http_request.return_value = HTTPProcessResult(
+                type="payment-error",
+                response=HTTPResponseInstructions(
+                    status=402,
+                    headers={"PAYMENT-REQUIRED": "encoded_header"},
+                    body={"error": "Payment required"},
+                    is_html=False,
+                ),
+            )
+            mock_http_server.return_value = mock_http_server_instance
+
+            PaymentMiddleware(app, {}, MagicMock(), sync_facilitator_on_start=False)
+
+            with app.test_client() as client:
+                response = client.get("/api/protected?country=US")
+
+        assert response.status_code == 402
+        assert len(built) == 1
+        context = mock_http_server_instance.process_http_request.call_args.args[0]
+        assert context.adapter.get_query_param("country") == "US"
+
     def test_verified_payment_proceeds_to_route(self):
         """Test that verified payment allows route access."""
         app = Flask(__name__)
@@ -0,0 +1,168 @@
+"""Unit tests for x402.http.facilitator_client - HTTP facilitator clients."""
+
+import sys
+
+import httpx
+import pytest
+
+from x402.http import FacilitatorConfig, HTTPFacilitatorClient, HTTPFacilitatorClientSync
+
+
+def get_pool(http_client: httpx.Client | httpx.AsyncClient):
+    """Helper to get the httpcore connection pool behind an httpx client."""
+    return http_client._transport._pool
+
+
+class TestConnectionPool:
+    """Tests for owned httpx client construction and reuse."""
+
+    @pytest.mark.asyncio
+    async def test_should_apply_pool_limits_from_config(self):
+        """Test that config pool limits reach the async client's pool."""
+        client = HTTPFacilitatorClient(
+            FacilitatorConfig(
+                url="https://facilitator.example",
+                max_connections=8,
+                max_keepalive_connections=4,
+                keepalive_expiry=12.0,
+            )
+        )
+
+        pool = get_pool(client._get_async_client())
+
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 4
+        assert pool._keepalive_expiry == 12.0
+        await client.aclose()
+
+    def test_should_apply_pool_limits_from_dict_config(self):
+        """Test that dict config overrides limits and keeps the other defaults."""
+        client = HTTPFacilitatorClientSync(
+            {"url": "https://facilitator.example", "max_keepalive_connections": 2}
+        )
+
+        pool = get_pool(client._get_client())
+
+        assert pool._max_keepalive_connections == 2
+        assert pool._max_connections == FacilitatorConfig().max_connections
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_should_use_http1_by_default(self):
+        """Test that the owned client does not negotiate HTTP/2 unless asked."""
+        client = HTTPFacilitatorClient(FacilitatorConfig(url="https://facilitator.example"))
+
+        assert get_pool(client._get_async_client())._http2 is False
+        await client.aclose()
+
+    def test_should_enable_http2_when_requested(self):
+        """Test that http2=True enables HTTP/2 on the owned client."""
+        pytest.importorskip("h2")
+        client = HTTPFacilitatorClientSync(
+            FacilitatorConfig(url="https://facilitator.example", http2=True)
+        )
+
+        assert get_pool(client._get_client())._http2 is True
+        client.close()
+
+    def test_should_raise_when_http2_requested_without_h2(self, monkeypatch):
+        """Test that http2=True without h2 surfaces httpx's ImportError."""
+        monkeypatch.setitem(sys.modules, "h2", None)
+        client = HTTPFacilitatorClientSync(
+            FacilitatorConfig(url="https://facilitator.example", http2=True)
+        )
+
+        with pytest.raises(ImportError, match="h2"):
+            client._get_client()
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_async_client_until_closed(self):
+        """Test that the async client is reused and recreated after aclose."""
+        client = HTTPFacilitatorClient(FacilitatorConfig(url="https://facilitator.example"))
+
+        first = client._get_async_client()
+        assert client._get_async_client() is first
+
+        await client.aclose()
+        assert first.is_closed
+        assert client._get_async_client() is not first
+        await client.aclose()
+
+    def test_should_reuse_sync_client_until_closed(self):
+        """Test that the sync client is reused until close."""
+        client = HTTPFacilitatorClientSync(FacilitatorConfig(url="https://facilitator.example"))
+
+        first = client._get_client()
+        assert client._get_client() is first
+
+        client.close()
+        assert first.is_closed
+
+    def test_should_not_close_injected_client(self):
+        """Test that a caller-provided http_client is left open."""
+        http_client = httpx.Client()
+        client = HTTPFacilitatorClientSync(
+            FacilitatorConfig(url="https://facilitator.example", http_client=http_client)
+        )
+
+        assert client._get_client() is http_client
+        client.close()
+        assert not http_client.is_closed
+        http_client.close()
+
+    @pytest.mark.asyncio
+    async def test_should_route_uds_through_pool_of_matching_kind(self):
+        """Test that uds builds a sync or async transport with the configured limits."""
+        config = FacilitatorConfig(
+            url="http://facilitator.local", uds="/tmp/x402.sock", max_connections=8
+        )
+        async_facilitator = HTTPFacilitatorClient(config)
+        sync_facilitator = HTTPFacilitatorClientSync(config)
+
+        async_client = async_facilitator._get_async_client()
+        sync_client = sync_facilitator._get_client()
+
+        assert isinstance(async_client._transport, httpx.AsyncHTTPTransport)
+        assert isinstance(sync_client._transport, httpx.HTTPTransport)
+        assert get_pool(async_client)._uds == "/tmp/x402.sock"
+        assert get_pool(sync_client)._max_connections == 8
+        await async_facilitator.aclose()
+        sync_facilitator.close()
+
+    def test_should_send_requests_over_uds(self, tmp_path):
+        """Test that get_supported reaches a server listening on a Unix socket."""
+        import http.server
+        import socketserver
+        import threading
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = b'{"kinds":[],"extensions":[],"signers":{}}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class UnixHTTPServer(socketserver.UnixStreamServer):
+            def get_request(self):
+                request, _ = super().get_request()
+                return request, ("uds", 0)
+
+        sock = str(tmp_path / "facilitator.sock")
+        with UnixHTTPServer(sock, Handler) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                client = HTTPFacilitatorClientSync(
+                    FacilitatorConfig(url="http://facilitator.local", uds=sock)
+                )
+                supported = client.get_supported()
+                client.close()
+            finally:
+                server.shutdown()
+
+        assert supported.kinds == []
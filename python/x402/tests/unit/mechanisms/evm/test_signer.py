@@ -1,8 +1,11 @@
 """Tests for EVM signer implementations."""
 
+from unittest.mock import patch
+
 import pytest
 
 try:
+    import requests
     from eth_account import Account
 except ImportError:
     pytest.skip("EVM signers require eth_account", allow_module_level=True)
@@ -123,6 +126,24 @@ class TestFacilitatorWeb3Signer:
 
         assert signer.address == account.address
 
+    def test_should_pass_session_to_http_provider(self):
+        """Should hand a provided requests session to web3's HTTPProvider."""
+        from web3 import Web3
+
+        account = Account.create()
+        session = requests.Session()
+
+        with patch(
+            "x402.mechanisms.evm.signers.Web3.HTTPProvider", wraps=Web3.HTTPProvider
+        ) as provider:
+            FacilitatorWeb3Signer(
+                private_key=account.key.hex(),
+                rpc_url="https://sepolia.base.org",
+                session=session,
+            )
+
+        provider.assert_called_once_with("https://sepolia.base.org", session=session)
+
     def test_should_have_required_methods(self):
         """Should have all required facilitator signer methods."""
         account = Account.create()
@@ -30,6 +30,18 @@ class TestExactSvmSchemeConstructor:
         assert client.scheme == "exact"
 
 
+class TestKeypairSigner:
+    """Test KeypairSigner."""
+
+    def test_address_is_base58_pubkey(self):
+        """Should expose the keypair's base58 public key as its address."""
+        keypair = Keypair()
+        signer = KeypairSigner(keypair)
+
+        assert signer.address == str(keypair.pubkey())
+        assert signer.keypair is keypair
+
+
 class TestCreatePaymentPayload:
     """Test create_payment_payload method."""
 